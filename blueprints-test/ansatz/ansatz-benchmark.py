@@ -0,0 +1,360 @@
+"""
+Ansatz 性能基准：覆盖构造（含格式校验）、to_expression、get_param_num、
+reduce_to_numeric_ansatz、+、mutate 与 apply_to，表达式规模为 1、10、100、1000 项
+（约 13、140、1400、14000 个语法树节点）。
+
+在 pywheels 0.8.3.2 上，1000 项的 + 会触发递归上限，100 项与 1000 项高参数密度的
+mutate 会因 astor 折行而解析失败，这几项只记录 error；其余各项均有耗时。
+
+结果以 JSON 写入 --output；若 --baseline 文件存在，则逐项与其比较，
+中位耗时超过基线 --threshold 倍即视为性能回退，脚本以退出码 1 结束；
+基线文件不存在时会打印提示并跳过比较。
+某项操作抛出异常时只记录 error 字段（不含耗时），不中断整个扫描；
+若该项在基线中正常、本次却失败，同样视为回退。
+使用 --save-baseline 可将本次结果保存为新的基线。
+
+示例（在仓库根目录运行）：
+    python blueprints-test/ansatz/ansatz-benchmark.py --save-baseline
+    python blueprints-test/ansatz/ansatz-benchmark.py
+"""
+import ast
+import sys
+import platform
+import argparse
+from os.path import exists
+from os.path import sep as seperator
+from statistics import median
+from time import perf_counter
+from collections import namedtuple
+from pywheels.file_tools.json import load_from_json
+from pywheels.file_tools.json import save_to_json
+from pywheels.blueprints.ansatz import Ansatz
+
+
+BenchmarkCase = namedtuple(
+    "BenchmarkCase",
+    [
+        "term_num", "param_density",
+    ]
+)
+
+
+# 每一项约 10 个节点；param_density 决定每项的参数个数
+benchmark_cases = [
+    BenchmarkCase(term_num = term_num, param_density = param_density)
+    for term_num in [1, 10, 100, 1000]
+    for param_density in ["low", "high"]
+]
+
+
+benchmark_functions = ["sin", "cos", "exp", "log"]
+
+
+def _make_expression(
+    term_num: int,
+    param_density: str,
+)-> str:
+
+    terms = []
+    param_no = 1
+
+    for i in range(term_num):
+
+        function = benchmark_functions[i % len(benchmark_functions)]
+        variable = "x" if i % 2 == 0 else "y"
+
+        if param_density == "low":
+            terms.append(f"param{param_no} * {function}({variable} + {variable} * {variable})")
+            param_no += 1
+        else:
+            terms.append(f"param{param_no} * {function}(param{param_no + 1} * {variable} + param{param_no + 2})")
+            param_no += 3
+
+    # 各项两两加括号组成平衡的加法树：左深的 a + b + c + ... 在约 1000 项时
+    # 会触发当前 pywheels 校验中的递归上限，平衡树的深度只有 log2(项数)
+    while len(terms) > 1:
+        terms = [
+            f"({terms[i]} + {terms[i + 1]})" if i + 1 < len(terms) else terms[i]
+            for i in range(0, len(terms), 2)
+        ]
+
+    return terms[0]
+
+
+def _make_ansatz(
+    case: BenchmarkCase,
+)-> Ansatz:
+
+    return Ansatz(
+        expression = _make_expression(case.term_num, case.param_density),
+        variables = ["x", "y"],
+        functions = benchmark_functions,
+        seed = 42,
+    )
+
+
+def _time_operation(
+    operation,
+    prepare,
+    min_seconds: float,
+    max_repeat: int,
+)-> list:
+
+    # prepare 在计时之外调用，为每次重复准备独立的输入
+    timings = []
+    total_seconds = 0.0
+
+    while len(timings) < max_repeat and (len(timings) < 3 or total_seconds < min_seconds):
+
+        operand = prepare()
+        start = perf_counter()
+        operation(operand)
+        elapsed = perf_counter() - start
+
+        timings.append(elapsed)
+        total_seconds += elapsed
+
+    return timings
+
+
+def _describe_error(
+    error: Exception,
+)-> str:
+
+    # 校验失败的报错中可能带有整条表达式，只保留首行
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0] if message else ''}"
+
+
+def _benchmark_case(
+    case: BenchmarkCase,
+    min_seconds: float,
+    max_repeat: int,
+    apply_to_trial_num: int,
+)-> list:
+
+    try:
+        ansatz = _make_ansatz(case)
+    except Exception as error:
+        print(f"{'construct':>26} | 项数 {case.term_num:>6} | 失败：{_describe_error(error)}")
+        return [{
+            "operation": "construct",
+            "term_num": case.term_num,
+            "param_density": case.param_density,
+            "error": _describe_error(error),
+        }]
+
+    other_ansatz = _make_ansatz(case)
+    param_num = ansatz.get_param_num()
+    node_num = sum(
+        1 for node in ast.walk(ast.parse(ansatz.to_expression(), mode = "eval"))
+        if not isinstance(node, ast.expr_context)
+    )
+    params = [0.5 + 0.001 * i for i in range(param_num)]
+    param_ranges = [(-1.0, 1.0)] * param_num
+
+    operations = {
+        "construct": (
+            lambda _: _make_ansatz(case),
+            lambda: None,
+        ),
+        "to_expression": (
+            lambda operand: operand.to_expression(),
+            lambda: ansatz,
+        ),
+        "get_param_num": (
+            lambda operand: operand.get_param_num(),
+            lambda: ansatz,
+        ),
+        "reduce_to_numeric_ansatz": (
+            lambda operand: operand.reduce_to_numeric_ansatz(params),
+            lambda: ansatz,
+        ),
+        "add": (
+            lambda operand: operand + other_ansatz,
+            lambda: ansatz,
+        ),
+        "mutate": (
+            lambda operand: operand.mutate(),
+            lambda: _make_ansatz(case),
+        ),
+        # 用户回调只取长度，测得的是 apply_to 自身（采样、渲染、循环）的开销
+        "apply_to": (
+            lambda operand: operand.apply_to(
+                numeric_ansatz_user = lambda numeric_ansatz: float(len(numeric_ansatz)),
+                param_ranges = param_ranges,
+                trial_num = apply_to_trial_num,
+                method = "random",
+            ),
+            lambda: _make_ansatz(case),
+        ),
+    }
+
+    results = []
+
+    for operation_name, (operation, prepare) in operations.items():
+
+        try:
+            timings = _time_operation(
+                operation = operation,
+                prepare = prepare,
+                min_seconds = min_seconds,
+                max_repeat = max_repeat,
+            )
+        except Exception as error:
+            results.append({
+                "operation": operation_name,
+                "term_num": case.term_num,
+                "param_density": case.param_density,
+                "node_num": node_num,
+                "param_num": param_num,
+                "error": _describe_error(error),
+            })
+            print(
+                f"{operation_name:>26} | 节点数 {node_num:>6} | 参数数 {param_num:>5} | "
+                f"失败：{_describe_error(error)}"
+            )
+            continue
+
+        results.append({
+            "operation": operation_name,
+            "term_num": case.term_num,
+            "param_density": case.param_density,
+            "node_num": node_num,
+            "param_num": param_num,
+            "repeat": len(timings),
+            "median_seconds": median(timings),
+            "min_seconds": min(timings),
+        })
+
+        print(
+            f"{operation_name:>26} | 节点数 {node_num:>6} | 参数数 {param_num:>5} | "
+            f"中位耗时 {median(timings) * 1000:>10.3f} ms（重复 {len(timings)} 次）"
+        )
+
+    return results
+
+
+def _get_result_key(
+    result: dict,
+)-> tuple:
+
+    return (result["operation"], result["term_num"], result["param_density"])
+
+
+def _compare_with_baseline(
+    results: list,
+    baseline_results: list,
+    threshold: float,
+)-> list:
+
+    baseline_by_key = {_get_result_key(result): result for result in baseline_results}
+    regressions = []
+
+    for result in results:
+
+        baseline_result = baseline_by_key.get(_get_result_key(result))
+        if baseline_result is None: continue
+
+        # 基线中正常、本次却抛出异常，是比变慢更严重的回退
+        if "error" in result:
+            if "error" not in baseline_result:
+                result["baseline_median_seconds"] = baseline_result["median_seconds"]
+                regressions.append(result)
+            continue
+
+        # 基线中失败的操作没有耗时，无从比较
+        if "error" in baseline_result: continue
+
+        ratio = result["median_seconds"] / max(baseline_result["median_seconds"], 1e-12)
+        result["baseline_median_seconds"] = baseline_result["median_seconds"]
+        result["ratio_to_baseline"] = ratio
+
+        if ratio > threshold:
+            regressions.append(result)
+
+    return regressions
+
+
+def main():
+
+    default_directory = f"blueprints-test{seperator}ansatz{seperator}"
+
+    parser = argparse.ArgumentParser(description = "Ansatz 性能基准")
+    parser.add_argument("--output", default = f"{default_directory}benchmark_output.json")
+    parser.add_argument("--baseline", default = f"{default_directory}benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action = "store_true")
+    parser.add_argument("--threshold", type = float, default = 1.25)
+    parser.add_argument("--min-seconds", type = float, default = 0.2)
+    parser.add_argument("--max-repeat", type = int, default = 50)
+    parser.add_argument("--apply-to-trial-num", type = int, default = 20)
+    parser.add_argument("--max-term-num", type = int, default = 1000)
+    arguments = parser.parse_args()
+
+    results = []
+
+    for case in benchmark_cases:
+
+        if case.term_num > arguments.max_term_num: continue
+
+        results.extend(_benchmark_case(
+            case = case,
+            min_seconds = arguments.min_seconds,
+            max_repeat = arguments.max_repeat,
+            apply_to_trial_num = arguments.apply_to_trial_num,
+        ))
+
+    regressions = []
+
+    if not arguments.save_baseline:
+
+        if exists(arguments.baseline):
+            regressions = _compare_with_baseline(
+                results = results,
+                baseline_results = load_from_json(arguments.baseline)["results"],
+                threshold = arguments.threshold,
+            )
+        else:
+            print(
+                f"未找到基线文件 {arguments.baseline}，跳过回退比较；"
+                f"可先使用 --save-baseline 生成基线"
+            )
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+        "regressions": [_get_result_key(result) for result in regressions],
+    }
+
+    save_to_json(json_path = arguments.output, obj = report)
+    print(f"基准结果已写入 {arguments.output}")
+
+    if arguments.save_baseline:
+
+        save_to_json(json_path = arguments.baseline, obj = report)
+        print(f"基线已保存至 {arguments.baseline}")
+
+    if regressions:
+
+        for result in regressions:
+            if "error" in result:
+                print(
+                    f"回退：{result['operation']}（项数 {result['term_num']}，"
+                    f"参数密度 {result['param_density']}）在基线中正常，本次失败：{result['error']}"
+                )
+            else:
+                print(
+                    f"性能回退：{result['operation']}（项数 {result['term_num']}，"
+                    f"参数密度 {result['param_density']}）为基线的 {result['ratio_to_baseline']:.2f} 倍"
+                )
+
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+
+    main()
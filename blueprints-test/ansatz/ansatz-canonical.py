@@ -0,0 +1,217 @@
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+try:
+    from pywheels.blueprints.ansatz import AnsatzPopulation
+except ImportError:
+    AnsatzPopulation = None
+
+
+AnsatzCanonicalCase = namedtuple(
+    "AnsatzCanonicalCase",
+    [
+        "expression1", "expression2",
+        "variables", "functions",
+        "expected",
+    ]
+)
+
+
+test_ansatz_canonical_cases = [
+
+    # ✅ 加法交换（参数随之重新编号）
+    AnsatzCanonicalCase(
+        expression1 = "cos(param1 * x) + log(param2 * x)",
+        expression2 = "log(param1 * x) + cos(param2 * x)",
+        variables = ["x"],
+        functions = ["cos", "log"],
+        expected = True,
+    ),
+
+    # ✅ 乘法交换
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x * sin(param2 * y)",
+        expression2 = "sin(param1 * y) * x * param2",
+        variables = ["x", "y"],
+        functions = ["sin"],
+        expected = True,
+    ),
+
+    # ✅ 仅参数编号不同
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x + param2 * y",
+        expression2 = "param2 * x + param1 * y",
+        variables = ["x", "y"],
+        functions = [],
+        expected = True,
+    ),
+
+    # ✅ 多项加法的任意重排
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x + param2 * y + param3 * exp(x)",
+        expression2 = "param1 * exp(x) + param2 * y + param3 * x",
+        variables = ["x", "y"],
+        functions = ["exp"],
+        expected = True,
+    ),
+
+    # ❌ 减法不可交换
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x - param2 * y",
+        expression2 = "param1 * y - param2 * x",
+        variables = ["x", "y"],
+        functions = [],
+        expected = False,
+    ),
+
+    # ❌ 除法不可交换
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x / y",
+        expression2 = "param1 * y / x",
+        variables = ["x", "y"],
+        functions = [],
+        expected = False,
+    ),
+
+    # ❌ 幂运算不可交换
+    AnsatzCanonicalCase(
+        expression1 = "x ** param1",
+        expression2 = "param1 ** x",
+        variables = ["x"],
+        functions = [],
+        expected = False,
+    ),
+
+    # ❌ 参数共享方式不同
+    AnsatzCanonicalCase(
+        expression1 = "param1 * x + param1 * y",
+        expression2 = "param1 * x + param2 * y",
+        variables = ["x", "y"],
+        functions = [],
+        expected = False,
+    ),
+
+    # ❌ 函数不同
+    AnsatzCanonicalCase(
+        expression1 = "sin(param1 * x)",
+        expression2 = "cos(param1 * x)",
+        variables = ["x"],
+        functions = ["sin", "cos"],
+        expected = False,
+    ),
+]
+
+
+@skipIf(not hasattr(Ansatz, "to_canonical_expression"), "当前 pywheels 的 Ansatz 尚未提供 to_canonical_expression")
+class TestAnsatzCanonical(TestCase):
+
+    def test_canonical_equivalence(self):
+
+        for i, case in enumerate(test_ansatz_canonical_cases):
+
+            with self.subTest(i = i):
+
+                ansatz1 = Ansatz(
+                    expression = case.expression1,
+                    variables = case.variables,
+                    functions = case.functions,
+                )
+
+                ansatz2 = Ansatz(
+                    expression = case.expression2,
+                    variables = case.variables,
+                    functions = case.functions,
+                )
+
+                self.assertEqual(
+                    ansatz1.to_canonical_expression() == ansatz2.to_canonical_expression(),
+                    case.expected,
+                )
+
+                self.assertEqual(
+                    ansatz1.get_structural_hash() == ansatz2.get_structural_hash(),
+                    case.expected,
+                )
+
+
+    def test_canonical_is_valid_ansatz(self):
+
+        ansatz = Ansatz(
+            expression = "log(param1 * x) + cos(param2 * x)",
+            variables = ["x"],
+            functions = ["cos", "log"],
+        )
+
+        canonical_ansatz = Ansatz(
+            expression = ansatz.to_canonical_expression(),
+            variables = ["x"],
+            functions = ["cos", "log"],
+        )
+
+        self.assertEqual(canonical_ansatz.get_param_num(), ansatz.get_param_num())
+        self.assertEqual(
+            canonical_ansatz.to_canonical_expression(),
+            ansatz.to_canonical_expression(),
+        )
+
+
+    def test_structural_hash_is_stable(self):
+
+        ansatz = Ansatz(
+            expression = "param1 * sin(param2 * x) + param3",
+            variables = ["x"],
+            functions = ["sin"],
+        )
+
+        # 哈希值需跨进程稳定（不依赖 PYTHONHASHSEED），因此是固定长度的十六进制串
+        structural_hash = ansatz.get_structural_hash()
+
+        self.assertIsInstance(structural_hash, str)
+        self.assertEqual(structural_hash, ansatz.get_structural_hash())
+        int(structural_hash, 16)
+
+
+    @skipIf(AnsatzPopulation is None, "当前 pywheels 尚未提供 AnsatzPopulation")
+    def test_population_dedup(self):
+
+        population = AnsatzPopulation()
+
+        expressions = [
+            "cos(param1 * x) + log(param2 * x)",
+            "log(param1 * x) + cos(param2 * x)",
+            "cos(param2 * x) + log(param1 * x)",
+            "cos(param1 * x) * log(param2 * x)",
+        ]
+
+        added = [
+            population.add(Ansatz(
+                expression = expression,
+                variables = ["x"],
+                functions = ["cos", "log"],
+            ))
+            for expression in expressions
+        ]
+
+        self.assertEqual(added, [True, False, False, True])
+        self.assertEqual(len(population), 2)
+        self.assertIn(
+            Ansatz(
+                expression = "log(param2 * x) * cos(param1 * x)",
+                variables = ["x"],
+                functions = ["cos", "log"],
+            ),
+            population,
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,148 @@
+import math
+from time import perf_counter
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+def _eval_numeric_ansatz(
+    ansatz: Ansatz,
+    params: list,
+    variable_values: dict,
+)-> float:
+
+    namespace = {function: getattr(math, function) for function in ["sin", "cos", "log", "exp"]}
+    namespace.update(variable_values)
+    return eval(ansatz.reduce_to_numeric_ansatz(params), namespace)
+
+
+@skipIf(not hasattr(Ansatz, "compile"), "当前 pywheels 的 Ansatz 尚未提供 compile")
+class TestAnsatzCompile(TestCase):
+
+    def test_matches_numeric_ansatz(self):
+
+        ansatz = Ansatz(
+            expression = "param1 * sin(param2 * x) + exp(param3 * y) / param4",
+            variables = ["x", "y"],
+            functions = ["sin", "exp"],
+        )
+
+        compiled_ansatz = ansatz.compile()
+
+        for i, params in enumerate([
+            [1.0, 2.0, 0.5, 3.0],
+            [-0.3, 1.7, -1.2, 0.9],
+            [2.5, -0.1, 0.0, 1.0],
+        ]):
+
+            with self.subTest(i = i):
+
+                variable_values = {"x": 0.3 * i + 0.1, "y": 1.0 - 0.2 * i}
+
+                self.assertAlmostEqual(
+                    compiled_ansatz(params, **variable_values),
+                    _eval_numeric_ansatz(ansatz, params, variable_values),
+                    places = 6,
+                )
+
+
+    def test_cached_on_instance(self):
+
+        ansatz = Ansatz(
+            expression = "param1 * x + param2",
+            variables = ["x"],
+            functions = [],
+        )
+
+        self.assertIs(ansatz.compile(), ansatz.compile())
+
+
+    def test_invalidated_by_mutate(self):
+
+        ansatz = Ansatz(
+            expression = "sin(param1 * x) + cos(param2 * x)",
+            variables = ["x"],
+            functions = ["sin", "cos", "log", "exp"],
+            seed = 123,
+        )
+
+        compiled_before = ansatz.compile()
+        ansatz.mutate()
+        compiled_after = ansatz.compile()
+
+        self.assertIsNot(compiled_after, compiled_before)
+
+        params = [0.7, 1.3]
+        variable_values = {"x": 2.0}
+
+        self.assertAlmostEqual(
+            compiled_after(params, **variable_values),
+            _eval_numeric_ansatz(ansatz, params, variable_values),
+            places = 6,
+        )
+
+
+    def test_add_gets_own_compiled(self):
+
+        ansatz1 = Ansatz(expression = "param1 * x", variables = ["x"], functions = [])
+        ansatz2 = Ansatz(expression = "param1 * x ** param2", variables = ["x"], functions = [])
+
+        compiled1 = ansatz1.compile()
+        sum_ansatz = ansatz1 + ansatz2
+
+        # 操作数本身不变，其缓存仍然有效
+        self.assertIs(ansatz1.compile(), compiled1)
+        self.assertIsNot(sum_ansatz.compile(), compiled1)
+
+        # param1 * x + param2 * x ** param3
+        params = [1.5, 0.5, 2.0]
+        self.assertEqual(sum_ansatz.get_param_num(), len(params))
+
+        self.assertAlmostEqual(
+            sum_ansatz.compile()(params, x = 1.2),
+            _eval_numeric_ansatz(sum_ansatz, params, {"x": 1.2}),
+            places = 6,
+        )
+
+
+    def test_faster_than_string_rendering(self):
+
+        ansatz = Ansatz(
+            expression = "param1 * sin(param2 * x) + param3 * cos(param4 * x) + param5",
+            variables = ["x"],
+            functions = ["sin", "cos"],
+        )
+
+        params = [1.0, 2.0, 3.0, 4.0, 5.0]
+        run_num = 10000
+
+        start = perf_counter()
+        for _ in range(run_num):
+            _eval_numeric_ansatz(ansatz, params, {"x": 0.5})
+        string_seconds = perf_counter() - start
+
+        compiled_ansatz = ansatz.compile()
+
+        start = perf_counter()
+        for _ in range(run_num):
+            compiled_ansatz(params, x = 0.5)
+        compiled_seconds = perf_counter() - start
+
+        self.assertLess(
+            compiled_seconds, string_seconds,
+            msg = (
+                f"字符串渲染 + eval {run_num} 次用时 {string_seconds:.3f} 秒，"
+                f"编译缓存 {run_num} 次用时 {compiled_seconds:.3f} 秒"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
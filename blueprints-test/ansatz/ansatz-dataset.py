@@ -0,0 +1,166 @@
+import numpy as np
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.blueprints.ansatz import Ansatz
+
+
+true_params = [2.0, 1.5, 0.3]
+param_ranges = [(0.5, 3.0), (1.0, 2.0), (-1.0, 1.0)]
+
+
+def _make_ansatz()-> Ansatz:
+
+    return Ansatz(
+        expression = "param1 * sin(param2 * x) + param3 * y",
+        variables = ["x", "y"],
+        functions = ["sin"],
+    )
+
+
+@skipIf(not hasattr(Ansatz, "evaluate_loss"), "当前 pywheels 的 Ansatz 尚未提供 evaluate_loss")
+class TestAnsatzDataset(TestCase):
+
+    def setUp(self):
+
+        rng = np.random.default_rng(0)
+        row_num = 200000
+
+        self.x = rng.uniform(-3.0, 3.0, size = row_num)
+        self.y = rng.uniform(-1.0, 1.0, size = row_num)
+        self.z = true_params[0] * np.sin(true_params[1] * self.x) + true_params[2] * self.y
+
+        self.temp_file_paths = []
+        self.npy_paths = {}
+
+        for name, column in [("x", self.x), ("y", self.y), ("z", self.z)]:
+            npy_path = get_temp_file_path(
+                suffix = ".npy",
+                prefix = f"tmp_AnsatzDataset_{name}_DeleteMe_",
+                directory = None,
+            )
+            np.save(npy_path, column)
+            self.npy_paths[name] = npy_path
+            self.temp_file_paths.append(npy_path)
+
+        self.table_path = get_temp_file_path(
+            suffix = ".npy",
+            prefix = "tmp_AnsatzDataset_table_DeleteMe_",
+            directory = None,
+        )
+        np.save(self.table_path, np.stack([self.z, self.x, self.y], axis = 1))
+        self.temp_file_paths.append(self.table_path)
+
+
+    def tearDown(self):
+
+        for temp_file_path in self.temp_file_paths:
+            delete_file(file_path = temp_file_path)
+
+
+    def test_loss_matches_numpy(self):
+
+        ansatz = _make_ansatz()
+        params = [1.0, 1.2, -0.2]
+        residual = params[0] * np.sin(params[1] * self.x) + params[2] * self.y - self.z
+
+        expected_losses = {
+            "mae": np.mean(np.abs(residual)),
+            "mse": np.mean(residual ** 2),
+        }
+
+        for loss, expected in expected_losses.items():
+
+            for chunk_size in [1000, 65536, None]:
+
+                with self.subTest(loss = loss, chunk_size = chunk_size):
+
+                    value = ansatz.evaluate_loss(
+                        params = params,
+                        dataset = {"x": self.x, "y": self.y, "z": self.z},
+                        target = "z",
+                        loss = loss,
+                        chunk_size = chunk_size,
+                    )
+
+                    self.assertAlmostEqual(value, expected, places = 9)
+
+
+    def test_memmap_matches_in_memory(self):
+
+        ansatz = _make_ansatz()
+        params = [1.0, 1.2, -0.2]
+
+        in_memory_value = ansatz.evaluate_loss(
+            params = params,
+            dataset = {"x": self.x, "y": self.y, "z": self.z},
+            target = "z",
+            loss = "mse",
+        )
+
+        # 以 .npy 路径传入的列通过 np.memmap 打开，不整体读入内存
+        memmap_value = ansatz.evaluate_loss(
+            params = params,
+            dataset = self.npy_paths,
+            target = "z",
+            loss = "mse",
+            chunk_size = 4096,
+        )
+
+        # 二维表格 + 列名绑定到 variables
+        table_value = ansatz.evaluate_loss(
+            params = params,
+            dataset = self.table_path,
+            columns = ["z", "x", "y"],
+            target = "z",
+            loss = "mse",
+            chunk_size = 4096,
+        )
+
+        self.assertAlmostEqual(memmap_value, in_memory_value, places = 9)
+        self.assertAlmostEqual(table_value, in_memory_value, places = 9)
+
+
+    def test_apply_to_dataset(self):
+
+        ansatz = _make_ansatz()
+
+        best_params, best_output = ansatz.apply_to(
+            dataset = self.npy_paths,
+            target = "z",
+            loss = "mse",
+            chunk_size = 65536,
+            param_ranges = param_ranges,
+            trial_num = 4,
+            method = "L-BFGS-B",
+            do_minimize = True,
+        )
+
+        self.assertLess(best_output, 1e-8)
+        np.testing.assert_allclose(best_params, true_params, atol = 1e-3)
+
+
+    def test_missing_column(self):
+
+        ansatz = _make_ansatz()
+
+        with self.assertRaises(RuntimeError):
+
+            ansatz.evaluate_loss(
+                params = [1.0, 1.0, 1.0],
+                dataset = {"x": self.x, "z": self.z},
+                target = "z",
+                loss = "mse",
+            )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
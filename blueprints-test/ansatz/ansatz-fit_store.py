@@ -0,0 +1,160 @@
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.blueprints.ansatz import Ansatz
+
+try:
+    from pywheels.blueprints.ansatz import AnsatzFitStore
+except ImportError:
+    AnsatzFitStore = None
+
+
+data = [(0.5 * i, (0.5 * i - 3.0) ** 2 + 0.2) for i in range(12)]
+
+
+@skipIf(AnsatzFitStore is None, "当前 pywheels 尚未提供 AnsatzFitStore")
+class TestAnsatzFitStore(TestCase):
+
+    def setUp(self):
+
+        self.store_path = get_temp_file_path(
+            suffix = ".sqlite",
+            prefix = "tmp_AnsatzFitStore_DeleteMe_",
+            directory = None,
+        )
+
+        self.call_num = 0
+
+
+    def tearDown(self):
+
+        delete_file(file_path = self.store_path)
+
+
+    def _numeric_ansatz_user(
+        self,
+        numeric_ansatz: str,
+    )-> float:
+
+        self.call_num += 1
+        return sum(
+            abs(eval(numeric_ansatz, {"x": x}) - y)
+            for x, y in data
+        ) / len(data)
+
+
+    def _fit(
+        self,
+        expression: str,
+        param_ranges: list,
+        dataset_fingerprint: str = "quadratic-v1",
+    )-> tuple:
+
+        ansatz = Ansatz(
+            expression = expression,
+            variables = ["x"],
+            functions = [],
+            constant_whitelist = ["2"],
+        )
+
+        return ansatz.apply_to(
+            numeric_ansatz_user = self._numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 4,
+            method = "L-BFGS-B",
+            do_minimize = True,
+            fit_store = AnsatzFitStore(local_storage_path = self.store_path),
+            dataset_fingerprint = dataset_fingerprint,
+        )
+
+
+    def test_hit_across_runs(self):
+
+        param_ranges = [(2.0, 4.0), (1.5, 2.5), (-0.5, 0.5)]
+
+        first_result = self._fit("(x - param1) ** param2 + param3", param_ranges)
+        first_call_num = self.call_num
+
+        self.call_num = 0
+
+        # 新建的 AnsatzFitStore 读取同一文件，相当于另一次作业
+        second_result = self._fit("(x - param1) ** param2 + param3", param_ranges)
+
+        self.assertGreater(first_call_num, 0)
+        self.assertEqual(self.call_num, 0)
+        self.assertEqual(second_result, first_result)
+
+
+    def test_hit_on_canonical_form(self):
+
+        param_ranges = [(0.1, 2.0), (0.1, 2.0)]
+
+        first_params, first_output = self._fit("param1 * x + param2 * x ** 2", param_ranges)
+        self.call_num = 0
+
+        # 与上式仅加法顺序不同，规范形式相同，但参数编号互换
+        swapped_expression = "param1 * x ** 2 + param2 * x"
+        best_params, best_output = self._fit(swapped_expression, param_ranges)
+
+        self.assertEqual(self.call_num, 0)
+
+        # 命中时返回的参数必须按新表达式的编号重新排列
+        self.assertEqual(best_params, [first_params[1], first_params[0]])
+        self.assertEqual(best_output, first_output)
+
+        swapped_ansatz = Ansatz(
+            expression = swapped_expression,
+            variables = ["x"],
+            functions = [],
+            constant_whitelist = ["2"],
+        )
+        self.assertAlmostEqual(
+            self._numeric_ansatz_user(swapped_ansatz.reduce_to_numeric_ansatz(best_params)),
+            best_output,
+            places = 9,
+        )
+
+
+    def test_miss_on_different_dataset(self):
+
+        param_ranges = [(2.0, 4.0), (1.5, 2.5), (-0.5, 0.5)]
+
+        self._fit("(x - param1) ** param2 + param3", param_ranges)
+        self.call_num = 0
+
+        self._fit(
+            "(x - param1) ** param2 + param3", param_ranges,
+            dataset_fingerprint = "quadratic-v2",
+        )
+
+        self.assertGreater(self.call_num, 0)
+
+
+    def test_warm_start_on_different_ranges(self):
+
+        first_params, first_output = self._fit(
+            "(x - param1) ** param2 + param3",
+            [(2.0, 4.0), (1.5, 2.5), (-0.5, 0.5)],
+        )
+        self.call_num = 0
+
+        # 范围不同，需要重新拟合，但应以已存最优点为起点
+        best_params, best_output = self._fit(
+            "(x - param1) ** param2 + param3",
+            [(1.0, 5.0), (1.0, 3.0), (-1.0, 1.0)],
+        )
+
+        self.assertGreater(self.call_num, 0)
+        self.assertLessEqual(best_output, first_output + 1e-9)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
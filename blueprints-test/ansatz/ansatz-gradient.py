@@ -0,0 +1,187 @@
+import math
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+AnsatzGradientCase = namedtuple(
+    "AnsatzGradientCase",
+    [
+        "expression", "variables", "functions",
+        "params", "variable_values",
+    ]
+)
+
+
+test_ansatz_gradient_cases = [
+
+    # 加法与乘法
+    AnsatzGradientCase(
+        expression = "param1 * x + param2 * y",
+        variables = ["x", "y"],
+        functions = [],
+        params = [1.5, -0.5],
+        variable_values = {"x": 2.0, "y": 3.0},
+    ),
+
+    # 幂运算（参数同时出现在底数与指数中）
+    AnsatzGradientCase(
+        expression = "(x - param1) ** param2 + param3",
+        variables = ["x"],
+        functions = [],
+        params = [3.0, 2.5, 0.1],
+        variable_values = {"x": 5.0},
+    ),
+
+    # 函数嵌套与除法
+    AnsatzGradientCase(
+        expression = "sin(cos(param1 * x)) + exp(param2 * y) / param3",
+        variables = ["x", "y"],
+        functions = ["sin", "cos", "exp"],
+        params = [0.7, -0.3, 2.0],
+        variable_values = {"x": 1.1, "y": 0.4},
+    ),
+
+    # 一元负号与对数、开方
+    AnsatzGradientCase(
+        expression = "-param1 * log(param2 * x) + sqrt(param3 * x)",
+        variables = ["x"],
+        functions = ["log", "sqrt"],
+        params = [1.2, 0.8, 2.0],
+        variable_values = {"x": 1.5},
+    ),
+]
+
+
+def _finite_difference_gradient(
+    ansatz: Ansatz,
+    params: list,
+    variable_values: dict,
+    step: float = 1e-6,
+)-> list:
+
+    namespace = {function: getattr(math, function) for function in ["sin", "cos", "exp", "log", "sqrt"]}
+    namespace.update(variable_values)
+
+    def evaluate(current_params):
+        return eval(ansatz.reduce_to_numeric_ansatz(current_params, stringify_format = ".17g"), namespace)
+
+    gradient = []
+    for i in range(len(params)):
+        forward = list(params); forward[i] += step
+        backward = list(params); backward[i] -= step
+        gradient.append((evaluate(forward) - evaluate(backward)) / (2 * step))
+    return gradient
+
+
+@skipIf(not hasattr(Ansatz, "compile_gradient"), "当前 pywheels 的 Ansatz 尚未提供 compile_gradient")
+class TestAnsatzGradient(TestCase):
+
+    def test_gradient_matches_finite_difference(self):
+
+        for i, case in enumerate(test_ansatz_gradient_cases):
+
+            with self.subTest(i = i, expression = case.expression):
+
+                ansatz = Ansatz(
+                    expression = case.expression,
+                    variables = case.variables,
+                    functions = case.functions,
+                )
+
+                value_and_gradient = ansatz.compile_gradient()
+
+                value, gradient = value_and_gradient(case.params, **case.variable_values)
+
+                self.assertAlmostEqual(
+                    value, ansatz.compile()(case.params, **case.variable_values), places = 9,
+                )
+                self.assertEqual(len(gradient), ansatz.get_param_num())
+
+                for analytic, numeric in zip(
+                    gradient,
+                    _finite_difference_gradient(ansatz, case.params, case.variable_values),
+                ):
+                    self.assertAlmostEqual(analytic, numeric, places = 4)
+
+
+    def test_apply_to_uses_gradient(self):
+
+        ansatz = Ansatz(
+            expression = "param1 * sin(param2 * x) + param3",
+            variables = ["x"],
+            functions = ["sin"],
+        )
+
+        data = [(0.1 * i, 2.0 * math.sin(1.5 * 0.1 * i) + 0.3) for i in range(50)]
+        compiled_ansatz = ansatz.compile()
+        value_and_gradient = ansatz.compile_gradient()
+
+        numeric_call_num = 0
+        gradient_call_num = 0
+
+        def numeric_ansatz_user(
+            numeric_ansatz: str,
+        )-> float:
+
+            nonlocal numeric_call_num
+            numeric_call_num += 1
+            return sum(
+                (eval(numeric_ansatz, {"sin": math.sin, "x": x}) - y) ** 2
+                for x, y in data
+            ) / len(data)
+
+        def gradient_ansatz_user(
+            params: list,
+        )-> tuple:
+
+            # 链式法则：d(MSE)/d(param) = mean(2 * (y_pred - y) * d(y_pred)/d(param))
+            nonlocal gradient_call_num
+            gradient_call_num += 1
+            loss = 0.0
+            loss_gradient = [0.0] * len(params)
+            for x, y in data:
+                y_pred, y_pred_gradient = value_and_gradient(params, x = x)
+                residual = y_pred - y
+                loss += residual ** 2 / len(data)
+                for i, partial in enumerate(y_pred_gradient):
+                    loss_gradient[i] += 2 * residual * partial / len(data)
+            return loss, loss_gradient
+
+        param_ranges = [(0.5, 3.0), (1.0, 2.0), (-1.0, 1.0)]
+
+        _, finite_difference_output = ansatz.apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 1,
+            method = "L-BFGS-B",
+        )
+
+        best_params, best_output = ansatz.apply_to(
+            gradient_ansatz_user = gradient_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 1,
+            method = "L-BFGS-B",
+        )
+
+        self.assertLess(best_output, 1e-6)
+        self.assertAlmostEqual(compiled_ansatz(best_params, x = 0.0), 0.3, places = 3)
+        self.assertLess(
+            gradient_call_num * 2, numeric_call_num,
+            msg = (
+                f"有限差分调用 {numeric_call_num} 次（误差 {finite_difference_output}），"
+                f"解析梯度调用 {gradient_call_num} 次（误差 {best_output}）"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
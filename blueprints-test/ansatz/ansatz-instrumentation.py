@@ -0,0 +1,175 @@
+import json
+from time import sleep
+from time import perf_counter
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.blueprints.ansatz import Ansatz
+
+# 缺少 AnsatzMetricsSink 时以 object 占位，使下方 RecordingMetricsSink 仍可定义
+try:
+    from pywheels.blueprints.ansatz import AnsatzMetricsSink
+    from pywheels.blueprints.ansatz import JsonLinesMetricsSink
+    supports_instrumentation = True
+except ImportError:
+    AnsatzMetricsSink = object
+    supports_instrumentation = False
+
+
+param_ranges = [
+    (2.0, 4.0),
+    (2.0, 4.0),
+    (-0.5, 0.5),
+]
+
+
+def numeric_ansatz_user(
+    numeric_ansatz: str
+)-> float:
+
+    # 人为放慢用户回调，使其在时间拆分中占主导
+    sleep(0.01)
+    return abs(eval(numeric_ansatz, {"x": 5.0}))
+
+
+def _make_ansatz()-> Ansatz:
+
+    return Ansatz(
+        expression = "(x - param1) ** param2 + param3",
+        variables = ["x"],
+        functions = [],
+    )
+
+
+class RecordingMetricsSink(AnsatzMetricsSink):
+
+    def __init__(self):
+
+        self.records = []
+
+
+    def record(self, metrics):
+
+        self.records.append(metrics)
+
+
+@skipIf(not supports_instrumentation, "当前 pywheels 尚未提供 AnsatzMetricsSink")
+class TestAnsatzInstrumentation(TestCase):
+
+    def test_progress_callback(self):
+
+        progress_list = []
+
+        start = perf_counter()
+
+        best_params, best_output = _make_ansatz().apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 30,
+            method = "random",
+            progress_callback = progress_list.append,
+        )
+
+        total_seconds = perf_counter() - start
+
+        self.assertEqual(len(progress_list), 30)
+        self.assertEqual([progress["trial_index"] for progress in progress_list], list(range(30)))
+
+        best_so_far = [progress["best_output"] for progress in progress_list]
+        self.assertEqual(best_so_far, sorted(best_so_far, reverse = True))
+        self.assertEqual(best_so_far[-1], best_output)
+        self.assertEqual(progress_list[-1]["best_params"], best_params)
+
+        elapsed = [progress["elapsed_seconds"] for progress in progress_list]
+        self.assertEqual(elapsed, sorted(elapsed))
+        self.assertLessEqual(elapsed[-1], total_seconds)
+        self.assertGreater(progress_list[-1]["evaluations_per_second"], 0.0)
+
+
+    def test_time_split_and_metrics_sink(self):
+
+        metrics_sink = RecordingMetricsSink()
+
+        _make_ansatz().apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 2,
+            method = "L-BFGS-B",
+            metrics_sink = metrics_sink,
+        )
+
+        self.assertEqual(len(metrics_sink.records), 1)
+        metrics = metrics_sink.records[0]
+
+        self.assertEqual(metrics["method"], "L-BFGS-B")
+        self.assertGreater(metrics["evaluation_num"], 0)
+
+        split_seconds = (
+            metrics["render_seconds"]
+            + metrics["user_callback_seconds"]
+            + metrics["optimizer_seconds"]
+        )
+
+        self.assertAlmostEqual(split_seconds, metrics["total_seconds"], delta = 0.05)
+        self.assertGreater(metrics["user_callback_seconds"], metrics["render_seconds"])
+        self.assertGreaterEqual(metrics["user_callback_seconds"], 0.01 * metrics["evaluation_num"])
+
+
+    def test_json_lines_metrics_sink(self):
+
+        metrics_path = get_temp_file_path(
+            suffix = ".jsonl",
+            prefix = "tmp_AnsatzMetrics_DeleteMe_",
+            directory = None,
+        )
+        self.addCleanup(delete_file, metrics_path)
+
+        metrics_sink = JsonLinesMetricsSink(metrics_path)
+
+        for _ in range(2):
+            _make_ansatz().apply_to(
+                numeric_ansatz_user = numeric_ansatz_user,
+                param_ranges = param_ranges,
+                trial_num = 5,
+                method = "random",
+                metrics_sink = metrics_sink,
+            )
+
+        with open(metrics_path, "r", encoding = "UTF-8") as file_pointer:
+            records = [json.loads(line) for line in file_pointer if line.strip()]
+
+        self.assertEqual(len(records), 2)
+        self.assertTrue(all(record["evaluation_num"] == 5 for record in records))
+
+
+    def test_default_is_unchanged(self):
+
+        # 不传入任何钩子时，结果与原来一致
+        self.assertEqual(
+            _make_ansatz().apply_to(
+                numeric_ansatz_user = numeric_ansatz_user,
+                param_ranges = param_ranges,
+                trial_num = 5,
+                method = "random",
+            ),
+            _make_ansatz().apply_to(
+                numeric_ansatz_user = numeric_ansatz_user,
+                param_ranges = param_ranges,
+                trial_num = 5,
+                method = "random",
+                progress_callback = lambda progress: None,
+                metrics_sink = RecordingMetricsSink(),
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
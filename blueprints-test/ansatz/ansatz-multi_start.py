@@ -0,0 +1,148 @@
+from threading import Lock
+from time import perf_counter
+from inspect import signature
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+def numeric_ansatz_user(
+    numeric_ansatz: str
+)-> float:
+
+    # 与 ansatz-apply_to.py 中的脚本等价，但直接在进程内求值
+    x = 5.0
+    y_truth = 0.0
+    y_pred = eval(numeric_ansatz, {"x": x})
+    return abs(y_pred - y_truth)
+
+
+# 当前发布版本的 apply_to 尚未提供并行参数时跳过
+supports_multi_start = "max_workers" in signature(Ansatz.apply_to).parameters
+
+
+# x = 5 时理论最优值为 0.5（param1 = 4，param3 = -0.5）
+param_ranges = [
+    (2.0, 4.0),
+    (2.0, 4.0),
+    (-0.5, 0.5),
+]
+
+
+def _make_ansatz(
+    seed: int,
+)-> Ansatz:
+
+    return Ansatz(
+        expression = "(x - param1) ** param2 + param3",
+        variables = ["x"],
+        functions = [],
+        seed = seed,
+    )
+
+
+@skipIf(not supports_multi_start, "当前 pywheels 的 Ansatz.apply_to 尚不支持 max_workers")
+class TestAnsatzMultiStart(TestCase):
+
+    def test_deterministic_across_worker_num(self):
+
+        results = []
+
+        for max_workers in [1, 2, 8]:
+
+            best_params, best_output = _make_ansatz(seed = 42).apply_to(
+                numeric_ansatz_user = numeric_ansatz_user,
+                param_ranges = param_ranges,
+                trial_num = 16,
+                method = "L-BFGS-B",
+                do_minimize = True,
+                max_workers = max_workers,
+            )
+
+            results.append((best_params, best_output))
+
+        # 每个起点的种子只由 Ansatz(seed=...) 和起点编号决定，与并行度无关
+        for i in range(1, len(results)):
+
+            with self.subTest(i = i):
+
+                self.assertEqual(results[i], results[0])
+
+
+    def test_same_as_sequential(self):
+
+        sequential_result = _make_ansatz(seed = 7).apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 8,
+            method = "L-BFGS-B",
+            do_minimize = True,
+        )
+
+        parallel_result = _make_ansatz(seed = 7).apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 8,
+            method = "L-BFGS-B",
+            do_minimize = True,
+            max_workers = 4,
+            parallel_method = "ProcessPoolExecutor",
+        )
+
+        self.assertEqual(parallel_result, sequential_result)
+
+
+    def test_early_termination(self):
+
+        call_num = 0
+        call_num_lock = Lock()
+
+        def counting_numeric_ansatz_user(
+            numeric_ansatz: str
+        )-> float:
+
+            nonlocal call_num
+            with call_num_lock: call_num += 1
+            return numeric_ansatz_user(numeric_ansatz)
+
+        full_best_params, full_best_output = _make_ansatz(seed = 42).apply_to(
+            numeric_ansatz_user = counting_numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 64,
+            method = "L-BFGS-B",
+            do_minimize = True,
+            max_workers = 4,
+        )
+        full_call_num = call_num
+
+        call_num = 0
+        start = perf_counter()
+
+        best_params, best_output = _make_ansatz(seed = 42).apply_to(
+            numeric_ansatz_user = counting_numeric_ansatz_user,
+            param_ranges = param_ranges,
+            trial_num = 64,
+            method = "L-BFGS-B",
+            do_minimize = True,
+            max_workers = 4,
+            target_output = 0.6,
+        )
+
+        end = perf_counter()
+
+        self.assertLessEqual(best_output, 0.6)
+        self.assertLess(
+            call_num, full_call_num,
+            msg = f"提前结束时调用 {call_num} / {full_call_num} 次，用时 {end - start:.2f} 秒",
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,133 @@
+import tracemalloc
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+parent_variables = ["x", "y"]
+parent_functions = ["sin", "cos", "exp", "log", "sqrt"]
+
+
+def _make_parent()-> Ansatz:
+
+    # 表达式保持在 80 字符以内：更长的表达式经 astor 渲染后会被折行，mutate 随之失败
+    return Ansatz(
+        expression = "sin(param1 * x) + cos(param2 * x) + exp(param3 * y) * log(param4 * y)",
+        variables = parent_variables,
+        functions = parent_functions,
+        seed = 42,
+    )
+
+
+@skipIf(not hasattr(Ansatz, "mutate_batch"), "当前 pywheels 的 Ansatz 尚未提供 mutate_batch")
+class TestAnsatzMutateBatch(TestCase):
+
+    def test_reproducible(self):
+
+        offspring1 = _make_parent().mutate_batch(n = 50, seed = 2024)
+        offspring2 = _make_parent().mutate_batch(n = 50, seed = 2024)
+        offspring3 = _make_parent().mutate_batch(n = 50, seed = 2025)
+
+        expressions1 = [child.to_expression() for child in offspring1]
+        expressions2 = [child.to_expression() for child in offspring2]
+        expressions3 = [child.to_expression() for child in offspring3]
+
+        self.assertEqual(len(expressions1), 50)
+        self.assertEqual(expressions1, expressions2)
+        self.assertNotEqual(expressions1, expressions3)
+
+
+    def test_parent_unchanged(self):
+
+        parent = _make_parent()
+        parent_expression = parent.to_expression()
+
+        parent.mutate_batch(n = 20, seed = 0)
+
+        self.assertEqual(parent.to_expression(), parent_expression)
+
+
+    def test_offspring_are_valid_ansatz(self):
+
+        parent = _make_parent()
+
+        for i, child in enumerate(parent.mutate_batch(n = 20, seed = 0)):
+
+            with self.subTest(i = i):
+
+                # 句柄可以物化为完整的 Ansatz，且通过格式校验
+                child_ansatz = child.to_ansatz()
+
+                rebuilt_ansatz = Ansatz(
+                    expression = child_ansatz.to_expression(),
+                    variables = parent_variables,
+                    functions = parent_functions,
+                )
+
+                self.assertEqual(rebuilt_ansatz.to_expression(), child.to_expression())
+                self.assertEqual(child.get_param_num(), rebuilt_ansatz.get_param_num())
+
+
+    def test_copy_on_write(self):
+
+        parent = _make_parent()
+        offspring = parent.mutate_batch(n = 10, seed = 0)
+        sibling_expressions = [child.to_expression() for child in offspring]
+
+        # 修改一个后代不应影响兄弟节点共享的子树
+        mutated_child = offspring[0].to_ansatz()
+        for _ in range(5): mutated_child.mutate()
+
+        self.assertEqual(
+            [child.to_expression() for child in offspring],
+            sibling_expressions,
+        )
+
+
+    def test_memory_footprint(self):
+
+        offspring_num = 2000
+
+        tracemalloc.start()
+        parent = _make_parent()
+        baseline, _ = tracemalloc.get_traced_memory()
+        offspring = parent.mutate_batch(n = offspring_num, seed = 0)
+        batch_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        parent = _make_parent()
+        baseline, _ = tracemalloc.get_traced_memory()
+        # Ansatz 持有线程锁，无法 deepcopy，因此以“按表达式重建 + mutate”作为对照
+        full_copies = []
+        for i in range(offspring_num):
+            child = Ansatz(
+                expression = parent.to_expression(),
+                variables = parent_variables,
+                functions = parent_functions,
+                seed = i,
+            )
+            child.mutate()
+            full_copies.append(child)
+        full_copy_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        self.assertEqual(len(offspring), offspring_num)
+        self.assertLess(
+            batch_bytes * 4, full_copy_bytes,
+            msg = (
+                f"{offspring_num} 个后代：mutate_batch 占用 {batch_bytes / 1024 / 1024:.1f} MiB，"
+                f"重建 + mutate 占用 {full_copy_bytes / 1024 / 1024:.1f} MiB"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
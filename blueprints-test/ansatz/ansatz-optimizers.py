@@ -0,0 +1,203 @@
+import numpy as np
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+# 缺少 AnsatzOptimizer 时以 object 占位，使下方 GridSampler 仍可定义
+try:
+    from pywheels.blueprints.ansatz import AnsatzOptimizer
+    supports_optimizers = True
+except ImportError:
+    AnsatzOptimizer = object
+    supports_optimizers = False
+
+
+# 批量方法使用新的名字："differential-evolution" 仍指现有的 SciPy 标量路径，
+# 其 trial_num 表示重启次数，而批量方法的 trial_num 表示总评估点数
+batched_methods = [
+    "cma-es", "batched-differential-evolution", "latin-hypercube", "sobol",
+]
+
+
+# 8 维：8 个高斯峰叠加，random 搜索在此预算下很难接近最优
+true_params = [0.3, -1.2, 0.8, 2.1, -0.5, 1.7, -2.4, 0.9]
+param_ranges = [(-3.0, 3.0)] * 8
+trial_num = 4000
+
+
+def _make_ansatz(
+    seed: int = 42,
+)-> Ansatz:
+
+    return Ansatz(
+        expression = " + ".join(
+            f"exp(-(x{i} - param{i + 1}) ** 2)" for i in range(8)
+        ),
+        variables = [f"x{i}" for i in range(8)],
+        functions = ["exp"],
+        constant_whitelist = ["2"],
+        seed = seed,
+    )
+
+
+class _CallRecorder:
+
+    def __init__(self, ansatz):
+
+        self.vectorized_ansatz = ansatz.compile_vectorized()
+        self.batch_shapes = []
+
+
+    def __call__(self, params_batch):
+
+        self.batch_shapes.append(params_batch.shape)
+        variable_values = {f"x{i}": true_params[i] for i in range(8)}
+        # 最大值为 8，因此 8 - 输出 即为到最优的距离
+        return 8.0 - self.vectorized_ansatz(params_batch, **variable_values)
+
+
+class GridSampler(AnsatzOptimizer):
+
+    """
+    用于验证可插拔接口的最简优化器：在每一维上等距取点后随机组合。
+    """
+
+    def __init__(self, seed = 0, generation_size = 100):
+
+        self._rng = np.random.default_rng(seed)
+        self._generation_size = generation_size
+
+
+    def ask(self, param_ranges):
+
+        lows = np.array([low for low, _ in param_ranges])
+        highs = np.array([high for _, high in param_ranges])
+        grid_indices = self._rng.integers(0, 11, size = (self._generation_size, len(param_ranges)))
+        return lows + (highs - lows) * grid_indices / 10
+
+
+    def tell(self, params_batch, outputs):
+
+        pass
+
+
+@skipIf(not supports_optimizers, "当前 pywheels 尚未提供 AnsatzOptimizer")
+class TestAnsatzOptimizers(TestCase):
+
+    def test_built_in_methods_beat_random(self):
+
+        ansatz = _make_ansatz()
+
+        _, random_output = ansatz.apply_to(
+            vectorized_ansatz_user = _CallRecorder(ansatz),
+            param_ranges = param_ranges,
+            trial_num = trial_num,
+            method = "random",
+        )
+
+        for method in batched_methods:
+
+            with self.subTest(method = method):
+
+                recorder = _CallRecorder(ansatz)
+
+                best_params, best_output = _make_ansatz().apply_to(
+                    vectorized_ansatz_user = recorder,
+                    param_ranges = param_ranges,
+                    trial_num = trial_num,
+                    method = method,
+                )
+
+                evaluated_num = sum(shape[0] for shape in recorder.batch_shapes)
+
+                # 每一代整体评估一次，而不是每个点回调一次；8 维时 CMA-ES 默认种群
+                # 为 4 + floor(3 ln 8) = 10，因此只要求每批多于一个点，不限定批大小
+                self.assertLessEqual(evaluated_num, trial_num)
+                self.assertTrue(
+                    all(shape[0] > 1 for shape in recorder.batch_shapes),
+                    msg = f"{method} 的批大小为 {[shape[0] for shape in recorder.batch_shapes]}",
+                )
+                self.assertTrue(all(shape[1] == 8 for shape in recorder.batch_shapes))
+
+                if method in ["cma-es", "batched-differential-evolution"]:
+                    self.assertLess(best_output, random_output)
+                    np.testing.assert_allclose(best_params, true_params, atol = 0.1)
+
+
+    def test_deterministic_with_seed(self):
+
+        for method in batched_methods:
+
+            with self.subTest(method = method):
+
+                results = [
+                    _make_ansatz(seed = 7).apply_to(
+                        vectorized_ansatz_user = _CallRecorder(_make_ansatz()),
+                        param_ranges = param_ranges,
+                        trial_num = 500,
+                        method = method,
+                    )
+                    for _ in range(2)
+                ]
+
+                self.assertEqual(results[0], results[1])
+
+
+    def test_pluggable_optimizer(self):
+
+        ansatz = _make_ansatz()
+        recorder = _CallRecorder(ansatz)
+
+        best_params, best_output = ansatz.apply_to(
+            vectorized_ansatz_user = recorder,
+            param_ranges = param_ranges,
+            trial_num = 1000,
+            method = GridSampler(seed = 0, generation_size = 100),
+        )
+
+        self.assertEqual(recorder.batch_shapes, [(100, 8)] * 10)
+        self.assertEqual(len(best_params), 8)
+
+        # 网格点坐标均为 -3.0 + 0.6k
+        for value in best_params:
+            self.assertAlmostEqual((value + 3.0) / 0.6, round((value + 3.0) / 0.6), places = 9)
+
+
+class TestScalarDifferentialEvolution(TestCase):
+
+    # 现有的 numeric_ansatz_user + "differential-evolution" 路径不受批量方法影响
+    def test_scalar_path_unchanged(self):
+
+        def numeric_ansatz_user(
+            numeric_ansatz: str
+        )-> float:
+
+            return abs(eval(numeric_ansatz, {"x": 5.0}))
+
+        best_params, best_output = Ansatz(
+            expression = "(x - param1) ** param2 + param3",
+            variables = ["x"],
+            functions = [],
+            seed = 42,
+        ).apply_to(
+            numeric_ansatz_user = numeric_ansatz_user,
+            param_ranges = [(2.0, 4.0), (2.0, 4.0), (-0.5, 0.5)],
+            trial_num = 2,
+            method = "differential-evolution",
+            do_minimize = True,
+        )
+
+        # 理论最优值为 0.5（param1 = 4，param3 = -0.5）
+        self.assertEqual(len(best_params), 3)
+        self.assertAlmostEqual(best_output, 0.5, delta = 1e-2)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,230 @@
+import math
+import random
+from time import perf_counter
+from functools import reduce
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+AnsatzSumCase = namedtuple(
+    "AnsatzSumCase",
+    [
+        "expressions", "variables", "functions", "exact_operators",
+    ]
+)
+
+
+# 逐次 + / * 会对已增强的项重复做线性增强（如 param1 * param2 * sin(...)），
+# 较长的结果还会被 astor 折行；exact_operators 只列出逐次运算不产生这类冗余的运算符，
+# 仅对这些运算符要求与逐次运算的渲染结果完全一致
+test_ansatz_sum_cases = [
+
+    # 两项，与 ansatz-add.py 的基本用例一致
+    AnsatzSumCase(
+        expressions = ["param1 * x", "param1 * y"],
+        variables = ["x", "y"],
+        functions = [],
+        exact_operators = ["+", "*"],
+    ),
+
+    # 多项函数表达式
+    AnsatzSumCase(
+        expressions = ["sin(param1 * x)", "cos(param1 * y)", "exp(param1 * x + param2)"],
+        variables = ["x", "y"],
+        functions = ["sin", "cos", "exp"],
+        exact_operators = ["+"],
+    ),
+
+    # 嵌套与括号
+    AnsatzSumCase(
+        expressions = [
+            "(param1 + param2 * x) / (y + param3)",
+            "sin(cos(param1 * x))",
+            "param1 * x ** param2",
+        ],
+        variables = ["x", "y"],
+        functions = ["sin", "cos"],
+        exact_operators = [],
+    ),
+
+    # 参数重用与一元运算符
+    AnsatzSumCase(
+        expressions = ["param1 * x + param1 * y", "-param1 * x", "+param1 * y", "param1 / x"],
+        variables = ["x", "y"],
+        functions = [],
+        exact_operators = [],
+    ),
+]
+
+
+# 运算符 -> (Ansatz 上对应的批量方法名, 逐次运算)
+operators = {
+    "+": ("sum", lambda left, right: left + right),
+    "*": ("product", lambda left, right: left * right),
+}
+
+
+def _make_ansatzes(
+    case: AnsatzSumCase,
+)-> list:
+
+    return [
+        Ansatz(
+            expression = expression,
+            variables = case.variables,
+            functions = case.functions,
+        )
+        for expression in case.expressions
+    ]
+
+
+def _evaluate_at_unit_params(
+    ansatz: Ansatz,
+    variable_values: dict,
+)-> float:
+
+    # 全部参数取 1 时，线性增强引入的系数不改变取值
+    namespace = {function: getattr(math, function) for function in ["sin", "cos", "exp"]}
+    namespace.update(variable_values)
+    return eval(
+        ansatz.reduce_to_numeric_ansatz([1.0] * ansatz.get_param_num()),
+        namespace,
+    )
+
+
+@skipIf(
+    not (hasattr(Ansatz, "sum") and hasattr(Ansatz, "product")),
+    "当前 pywheels 的 Ansatz 尚未提供 sum 与 product",
+)
+class TestAnsatzSum(TestCase):
+
+    def _check_exact(
+        self,
+        operator_name: str,
+    )-> None:
+
+        method_name, operator = operators[operator_name]
+        combine = getattr(Ansatz, method_name)
+
+        for i, case in enumerate(test_ansatz_sum_cases):
+
+            if operator_name not in case.exact_operators: continue
+
+            with self.subTest(i = i):
+
+                chained = reduce(operator, _make_ansatzes(case))
+                combined = combine(_make_ansatzes(case))
+
+                self.assertEqual(combined.to_expression(), chained.to_expression())
+                self.assertEqual(combined.get_param_num(), chained.get_param_num())
+
+
+    def test_sum_matches_chained_add(self):
+
+        self._check_exact("+")
+
+
+    def test_product_matches_chained_mul(self):
+
+        self._check_exact("*")
+
+
+    def test_valid_and_equivalent(self):
+
+        rng = random.Random(0)
+
+        for i, case in enumerate(test_ansatz_sum_cases):
+
+            for operator_name, (method_name, operator) in operators.items():
+
+                with self.subTest(i = i, operator = operator_name):
+
+                    combine = getattr(Ansatz, method_name)
+                    chained = reduce(operator, _make_ansatzes(case))
+                    combined = combine(_make_ansatzes(case))
+
+                    # 结果是合法的 Ansatz，且参数不多于逐次运算
+                    rebuilt = Ansatz(
+                        expression = combined.to_expression(),
+                        variables = case.variables,
+                        functions = case.functions,
+                    )
+                    self.assertEqual(rebuilt.get_param_num(), combined.get_param_num())
+                    self.assertLessEqual(combined.get_param_num(), chained.get_param_num())
+
+                    # 在若干采样点上，与各操作数直接求和 / 求积的取值一致
+                    for _ in range(5):
+
+                        variable_values = {
+                            variable: rng.uniform(0.5, 2.0) for variable in case.variables
+                        }
+                        expected = reduce(operator, [
+                            _evaluate_at_unit_params(ansatz, variable_values)
+                            for ansatz in _make_ansatzes(case)
+                        ])
+
+                        self.assertAlmostEqual(
+                            _evaluate_at_unit_params(combined, variable_values),
+                            expected,
+                            places = 9,
+                        )
+
+
+    def test_operands_unchanged(self):
+
+        ansatzes = _make_ansatzes(test_ansatz_sum_cases[1])
+        expressions = [ansatz.to_expression() for ansatz in ansatzes]
+
+        Ansatz.sum(ansatzes)
+
+        self.assertEqual([ansatz.to_expression() for ansatz in ansatzes], expressions)
+
+
+    def test_mismatched_variables(self):
+
+        with self.assertRaises(RuntimeError):
+
+            Ansatz.sum([
+                Ansatz(expression = "param1 * x", variables = ["x"], functions = []),
+                Ansatz(expression = "param1 * y", variables = ["y"], functions = []),
+            ])
+
+
+    def test_linear_scaling(self):
+
+        def build(term_num):
+            ansatzes = [
+                Ansatz(
+                    expression = "param1 * sin(param2 * x)",
+                    variables = ["x"],
+                    functions = ["sin"],
+                )
+                for _ in range(term_num)
+            ]
+            start = perf_counter()
+            summed = Ansatz.sum(ansatzes)
+            elapsed = perf_counter() - start
+            self.assertEqual(summed.get_param_num(), 2 * term_num)
+            return elapsed
+
+        small_seconds = build(100)
+        large_seconds = build(1000)
+
+        # 线性约为 10 倍，逐次 + 的二次增长约为 100 倍
+        self.assertLess(
+            large_seconds, small_seconds * 30,
+            msg = f"Ansatz.sum：100 项用时 {small_seconds:.3f} 秒，1000 项用时 {large_seconds:.3f} 秒",
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,221 @@
+from time import perf_counter
+from inspect import signature
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+# 当前发布版本的 Ansatz 尚未提供 trusted 参数时跳过
+supports_trusted = "trusted" in signature(Ansatz.__init__).parameters
+
+
+UntrustedCase = namedtuple(
+    "UntrustedCase",
+    ["expression", "variables", "functions", "constant_whitelist"]
+)
+
+
+# 与 ansatz-check_format.py 中的非法用例同类，trusted 默认为 False 时必须照常报错
+untrusted_cases = [
+
+    # ❌ 参数跳号
+    UntrustedCase(
+        expression = "param1 + param3",
+        variables = [],
+        functions = [],
+        constant_whitelist = [],
+    ),
+
+    # ❌ 未列入白名单的常量
+    UntrustedCase(
+        expression = "(x + param1) * 0.3",
+        variables = ["x"],
+        functions = [],
+        constant_whitelist = ["0.5"],
+    ),
+
+    # ❌ 未注册的函数
+    UntrustedCase(
+        expression = "cos(param1 * x)",
+        variables = ["x"],
+        functions = ["sin"],
+        constant_whitelist = [],
+    ),
+
+    # ❌ 未声明的变量
+    UntrustedCase(
+        expression = "z + param1",
+        variables = ["x"],
+        functions = [],
+        constant_whitelist = [],
+    ),
+]
+
+
+# trusted 构造跳过了完整校验，但与其他 Ansatz 相加时被触及的子树仍须重新校验
+bad_trusted_cases = [
+
+    # ❌ 未列入白名单的常量
+    UntrustedCase(
+        expression = "param1 * x + 0.3",
+        variables = ["x"],
+        functions = ["sin"],
+        constant_whitelist = [],
+    ),
+
+    # ❌ 未声明的变量
+    UntrustedCase(
+        expression = "sin(param1 * z)",
+        variables = ["x"],
+        functions = ["sin"],
+        constant_whitelist = [],
+    ),
+]
+
+
+@skipIf(not supports_trusted, "当前 pywheels 的 Ansatz 尚不支持 trusted 参数")
+class TestAnsatzTrusted(TestCase):
+
+    def test_untrusted_still_raises(self):
+
+        for i, case in enumerate(untrusted_cases):
+
+            with self.subTest(i = i, expr = case.expression):
+
+                with self.assertRaises(RuntimeError):
+
+                    Ansatz(
+                        expression = case.expression,
+                        variables = case.variables,
+                        functions = case.functions,
+                        constant_whitelist = case.constant_whitelist,
+                    )
+
+
+    def test_trusted_matches_validated(self):
+
+        expression = "param1 * sin(param2 * x) + param3 * cos(param4 * y)"
+
+        validated_ansatz = Ansatz(
+            expression = expression,
+            variables = ["x", "y"],
+            functions = ["sin", "cos"],
+        )
+
+        trusted_ansatz = Ansatz(
+            expression = expression,
+            variables = ["x", "y"],
+            functions = ["sin", "cos"],
+            trusted = True,
+        )
+
+        self.assertEqual(trusted_ansatz.to_expression(), validated_ansatz.to_expression())
+        self.assertEqual(trusted_ansatz.get_param_num(), validated_ansatz.get_param_num())
+
+
+    def test_incremental_validation_after_mutate_and_add(self):
+
+        functions = ["sin", "cos", "log", "exp"]
+
+        for i in range(20):
+
+            with self.subTest(i = i):
+
+                # 每轮从短表达式重新开始，避免超过 80 字符后被 astor 折行
+                ansatz = Ansatz(
+                    expression = "sin(param1 * x) + cos(param2 * x)",
+                    variables = ["x"],
+                    functions = functions,
+                    seed = i,
+                )
+
+                ansatz.mutate()
+                ansatz = ansatz + Ansatz(
+                    expression = "exp(param1 * x)",
+                    variables = ["x"],
+                    functions = functions,
+                    trusted = True,
+                )
+
+                # 增量校验的结论必须与完整校验一致
+                fully_validated = Ansatz(
+                    expression = ansatz.to_expression(),
+                    variables = ["x"],
+                    functions = functions,
+                )
+
+                self.assertEqual(ansatz.get_param_num(), fully_validated.get_param_num())
+
+
+    def test_incremental_validation_rejects_bad_subtree(self):
+
+        for i, case in enumerate(bad_trusted_cases):
+
+            with self.subTest(i = i, expr = case.expression):
+
+                validated_ansatz = Ansatz(
+                    expression = "sin(param1 * x)",
+                    variables = case.variables,
+                    functions = case.functions,
+                    constant_whitelist = case.constant_whitelist,
+                )
+
+                bad_ansatz = Ansatz(
+                    expression = case.expression,
+                    variables = case.variables,
+                    functions = case.functions,
+                    constant_whitelist = case.constant_whitelist,
+                    trusted = True,
+                )
+
+                with self.assertRaises(RuntimeError):
+                    validated_ansatz + bad_ansatz
+
+
+    def test_trusted_is_faster(self):
+
+        expression = " + ".join(
+            f"param{i + 1} * sin(x ** {i % 3 + 1})" for i in range(50)
+        )
+        construction_num = 200
+
+        start = perf_counter()
+        for _ in range(construction_num):
+            Ansatz(
+                expression = expression,
+                variables = ["x"],
+                functions = ["sin"],
+                constant_whitelist = ["1", "2", "3"],
+            )
+        validated_seconds = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(construction_num):
+            Ansatz(
+                expression = expression,
+                variables = ["x"],
+                functions = ["sin"],
+                constant_whitelist = ["1", "2", "3"],
+                trusted = True,
+            )
+        trusted_seconds = perf_counter() - start
+
+        self.assertLess(
+            trusted_seconds, validated_seconds,
+            msg = (
+                f"完整校验构造 {construction_num} 次用时 {validated_seconds:.3f} 秒，"
+                f"可信构造 {construction_num} 次用时 {trusted_seconds:.3f} 秒"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
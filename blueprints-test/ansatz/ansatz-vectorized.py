@@ -0,0 +1,140 @@
+import numpy as np
+from time import perf_counter
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.blueprints.ansatz import Ansatz
+
+
+AnsatzVectorizedCase = namedtuple(
+    "AnsatzVectorizedCase",
+    [
+        "expression", "variables", "functions",
+        "constant_whitelist", "param_ranges",
+    ]
+)
+
+
+test_ansatz_vectorized_cases = [
+
+    # 多项式
+    AnsatzVectorizedCase(
+        expression = "(x - param1) ** param2 + param3",
+        variables = ["x"],
+        functions = [],
+        constant_whitelist = [],
+        param_ranges = [(2.0, 4.0), (2.0, 4.0), (-0.5, 0.5)],
+    ),
+
+    # 函数嵌套
+    AnsatzVectorizedCase(
+        expression = "param1 * sin(param2 * x) + exp(-param3 * y)",
+        variables = ["x", "y"],
+        functions = ["sin", "exp"],
+        constant_whitelist = [],
+        param_ranges = [(-1.0, 1.0), (0.5, 2.0), (0.0, 1.0)],
+    ),
+
+    # 含白名单常量
+    AnsatzVectorizedCase(
+        expression = "param1 * log(x + 1) + sqrt(param2 * x) * pi",
+        variables = ["x"],
+        functions = ["log", "sqrt"],
+        constant_whitelist = ["1", "pi"],
+        param_ranges = [(0.1, 2.0), (0.1, 2.0)],
+    ),
+]
+
+
+@skipIf(not hasattr(Ansatz, "compile_vectorized"), "当前 pywheels 的 Ansatz 尚未提供 compile_vectorized")
+class TestAnsatzVectorized(TestCase):
+
+    def test_matches_numeric_ansatz(self):
+
+        for i, case in enumerate(test_ansatz_vectorized_cases):
+
+            with self.subTest(i = i):
+
+                ansatz = Ansatz(
+                    expression = case.expression,
+                    variables = case.variables,
+                    functions = case.functions,
+                    constant_whitelist = case.constant_whitelist,
+                )
+
+                vectorized_ansatz = ansatz.compile_vectorized()
+
+                rng = np.random.default_rng(42)
+                params_batch = np.stack(
+                    [rng.uniform(low, high, size = 64) for low, high in case.param_ranges],
+                    axis = 1,
+                )
+                variable_values = {
+                    variable: rng.uniform(0.5, 3.0, size = 10)
+                    for variable in case.variables
+                }
+
+                # 形状：[trials, 数据点数]
+                batch_output = vectorized_ansatz(params_batch, **variable_values)
+                self.assertEqual(batch_output.shape, (64, 10))
+
+                namespace = {"np": np, "pi": np.pi}
+                namespace.update({function: getattr(np, function) for function in case.functions})
+
+                for trial in range(0, 64, 7):
+
+                    numeric_ansatz = ansatz.reduce_to_numeric_ansatz(
+                        params = params_batch[trial].tolist(),
+                    )
+                    expected = eval(numeric_ansatz, dict(namespace, **variable_values))
+
+                    np.testing.assert_allclose(batch_output[trial], expected, rtol = 1e-6)
+
+
+    def test_apply_to_batched_random_search(self):
+
+        ansatz = Ansatz(
+            expression = "(x - param1) ** param2 + param3",
+            variables = ["x"],
+            functions = [],
+        )
+
+        vectorized_ansatz = ansatz.compile_vectorized()
+
+        def vectorized_ansatz_user(
+            params_batch: np.ndarray,
+        )-> np.ndarray:
+
+            x = 5.0
+            y_truth = 0.0
+            y_pred = vectorized_ansatz(params_batch, x = x)
+            return np.abs(y_pred - y_truth)
+
+        start = perf_counter()
+
+        best_params, best_output = ansatz.apply_to(
+            vectorized_ansatz_user = vectorized_ansatz_user,
+            param_ranges = [(2.0, 4.0), (2.0, 4.0), (-0.5, 0.5)],
+            trial_num = 100000,
+            method = "random",
+            do_minimize = True,
+        )
+
+        end = perf_counter()
+
+        self.assertEqual(len(best_params), 3)
+        # x = 5 时 (5 - param1) ** param2 在 param1 = 4 处取到最小值 1，
+        # 再加上 param3 的下界 -0.5，理论最优值为 0.5
+        self.assertAlmostEqual(best_output, 0.5, delta = 3e-2)
+        self.assertLess(end - start, 10, msg = f"100000 次批量随机搜索用时 {end - start:.2f} 秒")
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,157 @@
+import asyncio
+from time import perf_counter
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from mock_openai_server import MockOpenAIServer
+from pywheels.llm_tools.get_answer import load_api_keys
+from pywheels.llm_tools.get_answer import get_answer
+from pywheels.llm_tools.get_answer import get_answer_async
+
+try:
+    from pywheels.llm_tools.get_answer import configure_http_client_pool
+    from pywheels.llm_tools.get_answer import close_http_clients
+    from pywheels.llm_tools.get_answer import close_http_clients_async
+except ImportError:
+    configure_http_client_pool = None
+
+
+model = "Mock-Model"
+
+
+@skipIf(configure_http_client_pool is None, "当前 pywheels 尚未提供 configure_http_client_pool")
+class TestConnectionPool(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.server = MockOpenAIServer().__enter__()
+        cls.api_keys_path = cls.server.write_api_keys(model = model)
+        load_api_keys(cls.api_keys_path)
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        close_http_clients()
+        cls.server.__exit__(None, None, None)
+
+
+    def setUp(self):
+
+        close_http_clients()
+        configure_http_client_pool(max_connections = 4, max_keepalive_connections = 4)
+        self.server.reset_counters()
+
+
+    def test_sync_calls_reuse_connection(self):
+
+        for i in range(20):
+
+            self.assertEqual(
+                get_answer(prompt = f"hello {i}", model = model),
+                f"echo: hello {i}",
+            )
+
+        self.assertEqual(self.server.request_num, 20)
+        self.assertEqual(self.server.connection_num, 1)
+
+
+    def test_async_calls_bounded_by_pool_size(self):
+
+        request_num = 32
+        max_connections = 4
+        delay_seconds = 0.2
+
+        async def run():
+            return await asyncio.gather(*[
+                get_answer_async(prompt = f"hello {i}", model = model)
+                for i in range(request_num)
+            ])
+
+        # 每个请求都有延迟，请求才会真正并发地争用连接池
+        with MockOpenAIServer(delay_seconds = delay_seconds) as slow_server:
+
+            load_api_keys(slow_server.write_api_keys(model = model))
+            self.addCleanup(load_api_keys, self.api_keys_path)
+
+            start = perf_counter()
+            responses = asyncio.run(run())
+            elapsed = perf_counter() - start
+
+            close_http_clients()
+            asyncio.run(close_http_clients_async())
+
+        self.assertEqual(responses, [f"echo: hello {i}" for i in range(request_num)])
+        self.assertLessEqual(slow_server.connection_num, max_connections)
+
+        # 最多 4 个连接同时在途：总耗时不低于 32 / 4 * 0.2 秒，但远低于串行的 32 * 0.2 秒
+        self.assertGreaterEqual(elapsed, request_num / max_connections * delay_seconds)
+        self.assertLess(elapsed, request_num * delay_seconds / 2)
+
+
+    def test_sync_and_async_share_pool(self):
+
+        get_answer(prompt = "sync 1", model = model)
+        asyncio.run(get_answer_async(prompt = "async 1", model = model))
+        get_answer(prompt = "sync 2", model = model)
+        asyncio.run(get_answer_async(prompt = "async 2", model = model))
+
+        # 同一端点的同步客户端与异步客户端各自只建立一次连接，
+        # 且异步客户端跨越多次 asyncio.run 仍可复用
+        self.assertEqual(self.server.request_num, 4)
+        self.assertLessEqual(self.server.connection_num, 2)
+
+
+    def test_clean_shutdown(self):
+
+        get_answer(prompt = "before", model = model)
+        close_http_clients()
+        asyncio.run(close_http_clients_async())
+
+        # 关闭后再调用会重新建立连接，且结果不受影响
+        self.assertEqual(get_answer(prompt = "after", model = model), "echo: after")
+        self.assertEqual(self.server.connection_num, 2)
+
+
+class TestMockOpenAIServer(TestCase):
+
+    # 不依赖连接池接口，保证当前发布版本下共享的模拟服务器本身始终有测试覆盖
+    def test_echo_and_request_num(self):
+
+        with MockOpenAIServer() as server:
+
+            load_api_keys(server.write_api_keys(model = model))
+
+            self.assertEqual(get_answer(prompt = "hello", model = model), "echo: hello")
+            self.assertEqual(
+                asyncio.run(get_answer_async(prompt = "async hello", model = model)),
+                "echo: async hello",
+            )
+
+            self.assertEqual(server.request_num, 2)
+            self.assertEqual(server.request_bodies[0]["model"], model)
+
+
+    def test_fail_first_n(self):
+
+        # 400 不会被 OpenAI SDK 内部重试，第二次请求来自 get_answer 自身的重试
+        with MockOpenAIServer(fail_first_n = 1, fail_status = 400) as server:
+
+            load_api_keys(server.write_api_keys(model = model))
+
+            self.assertEqual(
+                get_answer(prompt = "retry me", model = model, trial_num = 2, trial_interval = 0),
+                "echo: retry me",
+            )
+            self.assertEqual(server.request_num, 2)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
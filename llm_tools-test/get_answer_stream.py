@@ -0,0 +1,189 @@
+import io
+import asyncio
+import contextlib
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from mock_openai_server import MockOpenAIServer
+from pywheels.llm_tools.get_answer import load_api_keys
+from pywheels.llm_tools.get_answer import get_answer
+
+try:
+    from pywheels.llm_tools.get_answer import get_answer_stream
+    from pywheels.llm_tools.get_answer import get_answer_stream_async
+except ImportError:
+    get_answer_stream = None
+
+
+model = "Mock-Model"
+flaky_model = "Mock-Flaky-Model"
+
+
+def _run_python(
+    code: str,
+)-> str:
+
+    stdout_capture = io.StringIO()
+    with contextlib.redirect_stdout(stdout_capture):
+        exec(code, {}, {})
+    return stdout_capture.getvalue()
+
+
+python_tool = {
+    "name": "execute_python_code",
+    "description": "执行一个 Python 代码块并返回其 stdout 输出。",
+    "parameters": {
+        "code": {
+            "type": "string",
+            "description": "要执行的 Python 代码字符串。",
+            "required": True,
+        },
+    },
+    "implementation": _run_python,
+}
+
+
+def _collect(
+    events,
+)-> tuple:
+
+    deltas = [event["content"] for event in events if event["type"] == "delta"]
+    done_events = [event for event in events if event["type"] == "done"]
+    return deltas, done_events
+
+
+@skipIf(get_answer_stream is None, "当前 pywheels 尚未提供 get_answer_stream")
+class TestGetAnswerStream(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.server = MockOpenAIServer(stream_chunk_size = 3).__enter__()
+        load_api_keys(cls.server.write_api_keys(model = model))
+
+        # 400 不会被 OpenAI SDK 内部重试，请求次数只反映 get_answer_stream 自身的重试
+        cls.flaky_server = MockOpenAIServer(
+            stream_chunk_size = 3, fail_first_n = 1, fail_status = 400,
+        ).__enter__()
+        load_api_keys(cls.flaky_server.write_api_keys(model = flaky_model))
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.server.__exit__(None, None, None)
+        cls.flaky_server.__exit__(None, None, None)
+
+
+    def test_deltas_assemble_to_answer(self):
+
+        prompt = "please stream this sentence back"
+
+        events = list(get_answer_stream(prompt = prompt, model = model))
+        deltas, done_events = _collect(events)
+
+        # 分多块到达，拼接后与非流式的结果一致
+        self.assertGreater(len(deltas), 5)
+        self.assertEqual(len(done_events), 1)
+        self.assertEqual("".join(deltas), done_events[0]["answer"])
+        self.assertEqual(done_events[0]["answer"], get_answer(prompt = prompt, model = model))
+
+
+    def test_retry_on_error(self):
+
+        self.flaky_server.reset_counters()
+
+        events = list(get_answer_stream(
+            prompt = "retry me",
+            model = flaky_model,
+            trial_num = 2,
+            trial_interval = 0,
+        ))
+
+        self.assertEqual([event["type"] for event in events].count("retry"), 1)
+        self.assertEqual(events[-1], {"type": "done", "answer": "echo: retry me"})
+        self.assertEqual(self.flaky_server.request_num, 2)
+
+
+    def test_check_and_accept_on_assembled_text(self):
+
+        checked_answers = []
+
+        def check_and_accept(answer):
+            checked_answers.append(answer)
+            return len(checked_answers) >= 2
+
+        events = list(get_answer_stream(
+            prompt = "check me",
+            model = model,
+            trial_num = 3,
+            trial_interval = 0,
+            check_and_accept = check_and_accept,
+        ))
+
+        # 验收函数收到的是完整回答而非片段；未通过时发出 retry 事件并重新流式输出
+        self.assertEqual(checked_answers, ["echo: check me", "echo: check me"])
+        self.assertEqual([event["type"] for event in events].count("retry"), 1)
+
+        deltas_after_retry = []
+        for event in reversed(events):
+            if event["type"] == "retry": break
+            if event["type"] == "delta": deltas_after_retry.insert(0, event["content"])
+        self.assertEqual("".join(deltas_after_retry), "echo: check me")
+
+
+    def test_all_trials_fail(self):
+
+        with self.assertRaises(RuntimeError):
+
+            list(get_answer_stream(
+                prompt = "never accepted",
+                model = model,
+                trial_num = 2,
+                trial_interval = 0,
+                check_and_accept = lambda _: False,
+            ))
+
+
+    def test_tool_call_mid_stream(self):
+
+        events = list(get_answer_stream(
+            prompt = "use the tool",
+            model = model,
+            tools = [python_tool],
+        ))
+
+        tool_call_events = [event for event in events if event["type"] == "tool_call"]
+
+        # 工具调用的参数分块到达，应在拼接完整后才执行
+        self.assertEqual(len(tool_call_events), 1)
+        self.assertEqual(tool_call_events[0]["name"], "execute_python_code")
+        self.assertEqual(tool_call_events[0]["arguments"], {"code": "print(6 * 7)"})
+        self.assertEqual(tool_call_events[0]["result"], "42\n")
+        self.assertEqual(events[-1], {"type": "done", "answer": "tool said: 42\n"})
+
+
+    def test_async(self):
+
+        async def run():
+            return [
+                event async for event in get_answer_stream_async(
+                    prompt = "async stream",
+                    model = model,
+                )
+            ]
+
+        deltas, done_events = _collect(asyncio.run(run()))
+
+        self.assertEqual("".join(deltas), "echo: async stream")
+        self.assertEqual(done_events[0]["answer"], "echo: async stream")
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
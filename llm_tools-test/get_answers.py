@@ -0,0 +1,161 @@
+import asyncio
+from time import perf_counter
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from mock_openai_server import MockOpenAIServer
+from pywheels.llm_tools.get_answer import load_api_keys
+from pywheels.llm_tools.get_answer import get_answer
+
+try:
+    from pywheels.llm_tools.get_answer import get_answers
+    from pywheels.llm_tools.get_answer import get_answers_async
+except ImportError:
+    get_answers = None
+
+
+model = "Mock-Model"
+
+
+@skipIf(get_answers is None, "当前 pywheels 尚未提供 get_answers")
+class TestGetAnswers(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.server = MockOpenAIServer(delay_seconds = 0.2).__enter__()
+        load_api_keys(cls.server.write_api_keys(model = model))
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.server.__exit__(None, None, None)
+
+
+    def test_ordered_results(self):
+
+        prompts = [f"question {i}" for i in range(12)]
+
+        results = get_answers(
+            prompts = prompts,
+            model = model,
+            max_concurrency = 12,
+        )
+
+        self.assertEqual(
+            [result["answer"] for result in results],
+            [f"echo: {prompt}" for prompt in prompts],
+        )
+        self.assertTrue(all(result["success"] for result in results))
+
+
+    def test_same_arguments_as_get_answer(self):
+
+        prompt = ["第一轮", "echo: 第一轮", "第二轮"]
+
+        self.assertEqual(
+            get_answers(
+                prompts = [prompt],
+                model = model,
+                system_prompt = "You are a mock.",
+                temperature = 0.0,
+                top_p = 1.0,
+                max_completion_tokens = 16,
+            )[0]["answer"],
+            get_answer(
+                prompt = prompt,
+                model = model,
+                system_prompt = "You are a mock.",
+                temperature = 0.0,
+                top_p = 1.0,
+                max_completion_tokens = 16,
+            ),
+        )
+
+
+    def test_per_item_errors(self):
+
+        prompts = [f"question {i}" for i in range(6)]
+
+        # 下标为奇数的回答不通过验收，但不影响其他条目
+        results = get_answers(
+            prompts = prompts,
+            model = model,
+            max_concurrency = 6,
+            trial_num = 1,
+            check_and_accept = lambda answer: int(answer.split()[-1]) % 2 == 0,
+        )
+
+        for i, result in enumerate(results):
+
+            with self.subTest(i = i):
+
+                if i % 2 == 0:
+                    self.assertTrue(result["success"])
+                    self.assertEqual(result["answer"], f"echo: question {i}")
+                    self.assertIsNone(result["error"])
+                else:
+                    self.assertFalse(result["success"])
+                    self.assertIsNone(result["answer"])
+                    self.assertIn("check_and_accept", result["error"])
+
+
+    def test_max_concurrency(self):
+
+        start = perf_counter()
+
+        get_answers(
+            prompts = [f"question {i}" for i in range(16)],
+            model = model,
+            max_concurrency = 4,
+        )
+
+        elapsed = perf_counter() - start
+
+        # 16 个请求、每个 0.2 秒、并发 4：约 0.8 秒，远小于串行的 3.2 秒
+        self.assertGreaterEqual(elapsed, 0.8)
+        self.assertLess(elapsed, 16 * 0.2)
+
+
+    def test_rate_limit(self):
+
+        start = perf_counter()
+
+        get_answers(
+            prompts = [f"question {i}" for i in range(40)],
+            model = model,
+            max_concurrency = 40,
+            rate_limit = 20.0,
+        )
+
+        elapsed = perf_counter() - start
+
+        # 令牌桶容量为每秒请求数，超出的 20 个请求至少需要再等约 1 秒
+        self.assertGreaterEqual(elapsed, 0.9)
+
+
+    def test_async(self):
+
+        prompts = [f"question {i}" for i in range(8)]
+
+        results = asyncio.run(get_answers_async(
+            prompts = prompts,
+            model = model,
+            max_concurrency = 8,
+        ))
+
+        self.assertEqual(
+            [result["answer"] for result in results],
+            [f"echo: {prompt}" for prompt in prompts],
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,178 @@
+import io
+import os
+import base64
+from time import sleep
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from mock_openai_server import MockOpenAIServer
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.llm_tools.get_answer import load_api_keys
+from pywheels.llm_tools.get_answer import get_answer
+
+try:
+    from pywheels.llm_tools.get_answer import configure_image_cache
+    from pywheels.llm_tools.get_answer import clear_image_cache
+    from pywheels.llm_tools.get_answer import get_image_cache_stats
+except ImportError:
+    configure_image_cache = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+model = "Mock-VL-Model"
+image_placeholder = "<image_never_used_1145141919810>"
+
+
+def _get_uploaded_image_urls(
+    request_body: dict,
+)-> list:
+
+    return [
+        part["image_url"]["url"]
+        for message in request_body["messages"]
+        if isinstance(message["content"], list)
+        for part in message["content"]
+        if part["type"] == "image_url"
+    ]
+
+
+@skipIf(configure_image_cache is None, "当前 pywheels 尚未提供 configure_image_cache")
+class TestImageCache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.server = MockOpenAIServer().__enter__()
+        load_api_keys(cls.server.write_api_keys(model = model))
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.server.__exit__(None, None, None)
+
+
+    def setUp(self):
+
+        self.server.reset_counters()
+        configure_image_cache(max_entries = 16, max_image_side = None)
+        clear_image_cache()
+
+        # 缓存配置是进程级的，测试结束后恢复默认配置（不带参数调用）并清空缓存
+        self.addCleanup(clear_image_cache)
+        self.addCleanup(configure_image_cache)
+
+        self.image_path = get_temp_file_path(
+            suffix = ".png",
+            prefix = "tmp_ImageCache_DeleteMe_",
+            directory = None,
+        )
+        with open(self.image_path, "wb") as file_pointer:
+            file_pointer.write(b"\x89PNG\r\n\x1a\n" + os.urandom(4096))
+
+
+    def tearDown(self):
+
+        delete_file(file_path = self.image_path)
+
+
+    def _converse(
+        self,
+        round_num: int,
+    )-> None:
+
+        # 与 multi_round_conversation.py 相同：每轮都附上同一张图片，并重发全部历史图片
+        prompt = []
+        images = []
+
+        for i in range(round_num):
+            prompt.append(f"{image_placeholder}第 {i + 1} 张图片里有啥？")
+            images.append(self.image_path)
+            response = get_answer(
+                prompt = prompt,
+                model = model,
+                images = images,
+                image_placeholder = image_placeholder,
+            )
+            prompt.append(response)
+
+
+    def test_encode_once_per_file(self):
+
+        self._converse(round_num = 3)
+
+        stats = get_image_cache_stats()
+
+        # 三轮共上传 1 + 2 + 3 = 6 次图片，只需编码一次
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 5)
+
+        uploaded_urls = [
+            url for body in self.server.request_bodies for url in _get_uploaded_image_urls(body)
+        ]
+        self.assertEqual(len(uploaded_urls), 6)
+        self.assertEqual(len(set(uploaded_urls)), 1)
+
+
+    def test_invalidated_when_file_changes(self):
+
+        self._converse(round_num = 1)
+
+        # 修改文件内容与大小（mtime 同时改变）后应重新编码
+        sleep(0.01)
+        with open(self.image_path, "ab") as file_pointer:
+            file_pointer.write(b"changed")
+
+        self._converse(round_num = 1)
+
+        stats = get_image_cache_stats()
+        self.assertEqual(stats["misses"], 2)
+
+        first_url, second_url = [
+            _get_uploaded_image_urls(body)[0] for body in self.server.request_bodies
+        ]
+        self.assertNotEqual(first_url, second_url)
+        self.assertTrue(base64.b64decode(second_url.split(",", 1)[1]).endswith(b"changed"))
+
+
+    @skipIf(Image is None, "缩放与重新压缩需要安装 Pillow")
+    def test_downscale_reduces_upload_bytes(self):
+
+        image = Image.effect_noise((2048, 1536), 64).convert("RGB")
+        image.save(self.image_path, format = "PNG")
+
+        self._converse(round_num = 1)
+        original_byte_num = self.server.request_byte_nums[-1]
+
+        configure_image_cache(max_entries = 16, max_image_side = 512, jpeg_quality = 85)
+        clear_image_cache()
+        self._converse(round_num = 1)
+        downscaled_byte_num = self.server.request_byte_nums[-1]
+
+        uploaded_url = _get_uploaded_image_urls(self.server.request_bodies[-1])[0]
+        uploaded_image = Image.open(io.BytesIO(base64.b64decode(uploaded_url.split(",", 1)[1])))
+
+        self.assertLessEqual(max(uploaded_image.size), 512)
+        self.assertAlmostEqual(uploaded_image.size[0] / uploaded_image.size[1], 2048 / 1536, places = 2)
+        self.assertLess(
+            downscaled_byte_num * 4, original_byte_num,
+            msg = (
+                f"原图上传 {original_byte_num / 1024:.0f} KiB，"
+                f"缩放后上传 {downscaled_byte_num / 1024:.0f} KiB（{uploaded_image.size}）"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,262 @@
+"""
+本地模拟的 OpenAI 兼容服务器，供 llm_tools-test 中的测试使用。
+
+- 仅实现 POST /v1/chat/completions，回复内容为 "echo: " + 最后一条用户文本；
+- 支持 "stream": true 的 SSE 流式回复，以及一次脚本化的工具调用；
+- 记录连接数、请求数与每个请求体，便于断言连接复用、缓存命中与上传字节数；
+- 前 fail_first_n 个请求以 fail_status 状态码失败；OpenAI SDK 会自动重试 5xx，
+  需要精确统计请求次数时可使用 400 等不被重试的状态码；
+- 使用 HTTP/1.1，支持 keep-alive。
+
+用法：
+    with MockOpenAIServer() as server:
+        api_keys_path = server.write_api_keys(model = "Mock-Model")
+        load_api_keys(api_keys_path)
+        ...
+"""
+import json
+import time
+from threading import Lock
+from threading import Thread
+from http.server import ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+
+
+class MockOpenAIServer:
+
+    def __init__(
+        self,
+        delay_seconds: float = 0.0,
+        fail_first_n: int = 0,
+        fail_status: int = 500,
+        stream_chunk_size: int = 4,
+    )-> None:
+
+        self.delay_seconds = delay_seconds
+        self.fail_first_n = fail_first_n
+        self.fail_status = fail_status
+        self.stream_chunk_size = stream_chunk_size
+
+        self.connection_num = 0
+        self.request_bodies = []
+        self.request_byte_nums = []
+        self._lock = Lock()
+        self._api_keys_paths = []
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = Thread(target = self._server.serve_forever, daemon = True)
+
+
+    @property
+    def base_url(self)-> str:
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+    @property
+    def request_num(self)-> int:
+
+        with self._lock:
+            return len(self.request_bodies)
+
+
+    def write_api_keys(
+        self,
+        model: str,
+    )-> str:
+
+        api_keys_path = get_temp_file_path(
+            suffix = ".json",
+            prefix = "tmp_MockApiKeys_DeleteMe_",
+            directory = None,
+        )
+
+        with open(api_keys_path, "w", encoding = "UTF-8") as file_pointer:
+            json.dump(
+                {model: [{"api_key": "sk-mock", "base_url": self.base_url, "model": model}]},
+                file_pointer,
+            )
+
+        self._api_keys_paths.append(api_keys_path)
+        return api_keys_path
+
+
+    def reset_counters(self)-> None:
+
+        with self._lock:
+            self.connection_num = 0
+            self.request_bodies = []
+            self.request_byte_nums = []
+
+
+    def __enter__(self):
+
+        self._thread.start()
+        return self
+
+
+    def __exit__(self, *_):
+
+        self._server.shutdown()
+        self._server.server_close()
+        for api_keys_path in self._api_keys_paths:
+            delete_file(file_path = api_keys_path)
+
+
+    def _make_handler(self):
+
+        mock_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+
+                super().setup()
+                with mock_server._lock:
+                    mock_server.connection_num += 1
+
+
+            def log_message(self, *_):
+
+                pass
+
+
+            def do_POST(self):
+
+                raw_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                body = json.loads(raw_body)
+
+                with mock_server._lock:
+                    mock_server.request_bodies.append(body)
+                    mock_server.request_byte_nums.append(len(raw_body))
+                    request_index = len(mock_server.request_bodies) - 1
+
+                if mock_server.delay_seconds:
+                    time.sleep(mock_server.delay_seconds)
+
+                if request_index < mock_server.fail_first_n:
+                    self._send_json(
+                        mock_server.fail_status,
+                        {"error": {"message": "mock failure", "type": "server_error"}},
+                    )
+                    return
+
+                message = self._make_message(body)
+
+                if body.get("stream"):
+                    self._send_stream(body, message)
+                else:
+                    self._send_json(200, {
+                        "id": f"chatcmpl-mock-{request_index}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": body["model"],
+                        "choices": [{
+                            "index": 0,
+                            "message": message,
+                            "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+                        }],
+                        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                    })
+
+
+            def _make_message(self, body):
+
+                messages = body["messages"]
+
+                # 提供了工具且尚无工具结果时，先发起一次工具调用
+                if body.get("tools") and not any(message["role"] == "tool" for message in messages):
+                    tool_name = body["tools"][0]["function"]["name"]
+                    return {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": [{
+                            "id": "call_mock_0",
+                            "type": "function",
+                            "function": {
+                                "name": tool_name,
+                                "arguments": json.dumps({"code": "print(6 * 7)"}),
+                            },
+                        }],
+                    }
+
+                tool_messages = [message for message in messages if message["role"] == "tool"]
+                if tool_messages:
+                    return {"role": "assistant", "content": f"tool said: {tool_messages[-1]['content']}"}
+
+                user_content = [message for message in messages if message["role"] == "user"][-1]["content"]
+                if isinstance(user_content, list):
+                    user_content = "".join(
+                        part["text"] if part["type"] == "text" else "<image>"
+                        for part in user_content
+                    )
+
+                return {"role": "assistant", "content": f"echo: {user_content}"}
+
+
+            def _send_json(self, status, obj):
+
+                payload = json.dumps(obj).encode("UTF-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+
+            def _send_stream(self, body, message):
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def send_chunk(delta, finish_reason = None):
+                    event = {
+                        "id": "chatcmpl-mock-stream",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": body["model"],
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                    }
+                    self._write_chunked(f"data: {json.dumps(event)}\n\n".encode("UTF-8"))
+
+                if message.get("tool_calls"):
+                    tool_call = message["tool_calls"][0]
+                    arguments = tool_call["function"]["arguments"]
+                    send_chunk({"role": "assistant", "tool_calls": [{
+                        "index": 0, "id": tool_call["id"], "type": "function",
+                        "function": {"name": tool_call["function"]["name"], "arguments": ""},
+                    }]})
+                    # 工具调用参数分多块到达
+                    for start in range(0, len(arguments), mock_server.stream_chunk_size):
+                        send_chunk({"tool_calls": [{
+                            "index": 0,
+                            "function": {"arguments": arguments[start : start + mock_server.stream_chunk_size]},
+                        }]})
+                    send_chunk({}, finish_reason = "tool_calls")
+                else:
+                    content = message["content"]
+                    send_chunk({"role": "assistant", "content": ""})
+                    for start in range(0, len(content), mock_server.stream_chunk_size):
+                        send_chunk({"content": content[start : start + mock_server.stream_chunk_size]})
+                        if mock_server.delay_seconds:
+                            time.sleep(mock_server.delay_seconds)
+                    send_chunk({}, finish_reason = "stop")
+
+                self._write_chunked(b"data: [DONE]\n\n")
+                self._write_chunked(b"")
+
+
+            def _write_chunked(self, data):
+
+                self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+        return Handler
@@ -0,0 +1,204 @@
+from time import sleep
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from mock_openai_server import MockOpenAIServer
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.llm_tools.get_answer import load_api_keys
+from pywheels.llm_tools.get_answer import get_answer
+
+try:
+    from pywheels.llm_tools.get_answer import ResponseCache
+except ImportError:
+    ResponseCache = None
+
+
+model = "Mock-Model"
+other_model = "Mock-Other-Model"
+
+
+# 最小的合法 PNG 文件头，内容不同即视为不同图片
+png_bytes_a = b"\x89PNG\r\n\x1a\n" + b"A" * 64
+png_bytes_b = b"\x89PNG\r\n\x1a\n" + b"B" * 64
+
+
+def _echo_tool_implementation(code: str)-> str:
+
+    return code
+
+
+echo_tool = {
+    "name": "echo",
+    "description": "原样返回输入。",
+    "parameters": {
+        "code": {"type": "string", "description": "任意文本。", "required": True},
+    },
+    "implementation": _echo_tool_implementation,
+}
+
+
+@skipIf(ResponseCache is None, "当前 pywheels 尚未提供 ResponseCache")
+class TestResponseCache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.server = MockOpenAIServer().__enter__()
+        load_api_keys(cls.server.write_api_keys(model = model))
+        load_api_keys(cls.server.write_api_keys(model = other_model))
+
+        cls.temp_file_paths = []
+        cls.image_paths = {}
+
+        for name, image_bytes in [("a", png_bytes_a), ("a_copy", png_bytes_a), ("b", png_bytes_b)]:
+            image_path = get_temp_file_path(
+                suffix = ".png",
+                prefix = f"tmp_ResponseCache_{name}_DeleteMe_",
+                directory = None,
+            )
+            with open(image_path, "wb") as file_pointer:
+                file_pointer.write(image_bytes)
+            cls.image_paths[name] = image_path
+            cls.temp_file_paths.append(image_path)
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        for temp_file_path in cls.temp_file_paths:
+            delete_file(file_path = temp_file_path)
+
+        cls.server.__exit__(None, None, None)
+
+
+    def setUp(self):
+
+        self.server.reset_counters()
+
+
+    def _ask(self, response_cache, **overrides):
+
+        arguments = {
+            "prompt": "<image>what is this?",
+            "model": model,
+            "system_prompt": "You are a mock.",
+            "images": [self.image_paths["a"]],
+            "temperature": 0.0,
+            "top_p": 1.0,
+            "max_completion_tokens": 64,
+        }
+        arguments.update(overrides)
+
+        return get_answer(response_cache = response_cache, **arguments)
+
+
+    def test_hit_skips_request(self):
+
+        response_cache = ResponseCache(max_entries = 64)
+
+        first_answer = self._ask(response_cache)
+        second_answer = self._ask(response_cache)
+
+        self.assertEqual(first_answer, second_answer)
+        self.assertEqual(self.server.request_num, 1)
+
+        stats = response_cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+
+
+    def test_image_keyed_by_content(self):
+
+        response_cache = ResponseCache(max_entries = 64)
+
+        self._ask(response_cache, images = [self.image_paths["a"]])
+        self._ask(response_cache, images = [self.image_paths["a_copy"]])
+
+        # 路径不同但内容相同，命中缓存
+        self.assertEqual(self.server.request_num, 1)
+
+
+    def test_every_key_component_matters(self):
+
+        variations = {
+            "model": {"model": other_model},
+            "system_prompt": {"system_prompt": "You are another mock."},
+            "prompt": {"prompt": "<image>what else?"},
+            "prompt_list": {"prompt": ["hi", "echo: hi", "<image>what is this?"]},
+            "images": {"images": [self.image_paths["b"]]},
+            "temperature": {"temperature": 0.5},
+            "top_p": {"top_p": 0.9},
+            "max_completion_tokens": {"max_completion_tokens": 128},
+            "tools": {"tools": [echo_tool]},
+        }
+
+        for name, overrides in variations.items():
+
+            with self.subTest(component = name):
+
+                response_cache = ResponseCache(max_entries = 64)
+                self._ask(response_cache)
+                self.server.reset_counters()
+
+                self._ask(response_cache, **overrides)
+
+                self.assertGreaterEqual(self.server.request_num, 1)
+
+
+    def test_lru_and_ttl(self):
+
+        response_cache = ResponseCache(max_entries = 2, ttl_seconds = 1)
+
+        self._ask(response_cache, prompt = "<image>0")
+        self._ask(response_cache, prompt = "<image>1")
+        self._ask(response_cache, prompt = "<image>0")
+        self._ask(response_cache, prompt = "<image>2")
+        self.assertEqual(self.server.request_num, 3)
+
+        # "1" 最久未使用，已被淘汰
+        self._ask(response_cache, prompt = "<image>1")
+        self.assertEqual(self.server.request_num, 4)
+        self.assertEqual(response_cache.get_stats()["evictions"], 2)
+
+        sleep(1.5)
+        self._ask(response_cache, prompt = "<image>1")
+        self.assertEqual(self.server.request_num, 5)
+
+
+    def test_sqlite_persistence(self):
+
+        cache_path = get_temp_file_path(
+            suffix = ".sqlite",
+            prefix = "tmp_ResponseCache_DeleteMe_",
+            directory = None,
+        )
+        self.addCleanup(delete_file, cache_path)
+
+        first_answer = self._ask(ResponseCache(local_storage_path = cache_path))
+        second_answer = self._ask(ResponseCache(local_storage_path = cache_path))
+
+        self.assertEqual(first_answer, second_answer)
+        self.assertEqual(self.server.request_num, 1)
+
+
+    def test_rejected_answers_not_cached(self):
+
+        response_cache = ResponseCache(max_entries = 64)
+
+        with self.assertRaises(RuntimeError):
+            self._ask(response_cache, trial_num = 1, check_and_accept = lambda _: False)
+
+        self._ask(response_cache)
+
+        self.assertEqual(self.server.request_num, 2)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,131 @@
+from time import perf_counter
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.task_runner.task_runner import execute_python_script
+
+try:
+    from pywheels.task_runner.task_runner import execute_python_scripts
+except ImportError:
+    execute_python_scripts = None
+
+
+def _make_scripts(
+    script_num: int,
+)-> list:
+
+    # 耗时随下标递减，便于区分按序交付与按完成顺序交付
+    return [
+        (
+            f"import time\n"
+            f"time.sleep({0.05 * (script_num - i)})\n"
+            f"print({i} * {i}, end = \"\")\n"
+        )
+        for i in range(script_num)
+    ]
+
+
+@skipIf(execute_python_scripts is None, "当前 pywheels 尚未提供 execute_python_scripts")
+class TestExecutePythonScripts(TestCase):
+
+    def test_ordered_delivery(self):
+
+        scripts = _make_scripts(8)
+
+        results = list(execute_python_scripts(
+            scripts = scripts,
+            max_workers = 4,
+            timeout_seconds = 5,
+            delivery = "ordered",
+        ))
+
+        self.assertEqual([index for index, _ in results], list(range(8)))
+
+        for index, run_script_result in results:
+
+            with self.subTest(i = index):
+
+                self.assertTrue(run_script_result["success"])
+                self.assertEqual(run_script_result["stdout"], str(index * index))
+
+
+    def test_as_completed_delivery(self):
+
+        scripts = _make_scripts(8)
+
+        results = list(execute_python_scripts(
+            scripts = scripts,
+            max_workers = 8,
+            timeout_seconds = 5,
+            delivery = "as_completed",
+        ))
+
+        self.assertEqual(sorted(index for index, _ in results), list(range(8)))
+
+        for index, run_script_result in results:
+
+            with self.subTest(i = index):
+
+                self.assertEqual(run_script_result["stdout"], str(index * index))
+
+
+    def test_same_dict_shape(self):
+
+        scripts = [
+            'print("ok", end = "")',
+            'raise ValueError("boom")',
+            'import time; time.sleep(10)',
+        ]
+
+        batch_results = {
+            index: run_script_result for index, run_script_result in execute_python_scripts(
+                scripts = scripts,
+                max_workers = 3,
+                timeout_seconds = 1,
+                delivery = "as_completed",
+            )
+        }
+
+        self.assertEqual(sorted(batch_results), list(range(len(scripts))))
+
+        for i, script in enumerate(scripts):
+
+            with self.subTest(i = i):
+
+                single_result = execute_python_script(
+                    script_content = script,
+                    timeout_seconds = 1,
+                )
+
+                self.assertEqual(set(batch_results[i]), set(single_result))
+                self.assertEqual(batch_results[i]["success"], single_result["success"])
+                self.assertEqual(batch_results[i]["stdout"], single_result["stdout"])
+                self.assertEqual(batch_results[i]["timeout"], single_result["timeout"])
+
+
+    def test_parallel_speedup(self):
+
+        scripts = ["import time; time.sleep(0.5)"] * 8
+
+        start = perf_counter()
+        for _ in execute_python_scripts(
+            scripts = scripts,
+            max_workers = 8,
+            timeout_seconds = 5,
+        ): pass
+        end = perf_counter()
+
+        self.assertLess(
+            end - start, 8 * 0.5,
+            msg = f"8 个各耗时 0.5 秒的脚本并行执行，用时 {end - start:.2f} 秒",
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,177 @@
+import os
+from time import perf_counter
+from inspect import signature
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.task_runner.task_runner import execute_python_script
+
+
+# 当前发布版本尚未提供 mode 参数时跳过
+supports_mode = "mode" in signature(execute_python_script).parameters
+
+
+InProcessModeCase = namedtuple(
+    "InProcessModeCase",
+    [
+        "script_content", "timeout_seconds",
+    ]
+)
+
+
+in_process_mode_cases = [
+
+    # 1. ansatz-apply_to.py 生成的典型脚本
+    InProcessModeCase(
+        script_content = (
+            'import numpy as np\n'
+            '\n'
+            '\n'
+            'if __name__ == "__main__":\n'
+            '\n'
+            '    x = 5.0\n'
+            '    y_truth = 0.0\n'
+            '    y_pred = (x - 3.0) ** 2.0 + 0.1\n'
+            '\n'
+            '    mean_absolute_error = abs(y_pred - y_truth)\n'
+            '\n'
+            '    print(mean_absolute_error, end = "")\n'
+        ),
+        timeout_seconds = 1,
+    ),
+
+    # 2. 数值异常
+    InProcessModeCase(
+        script_content = 'print(1 / 0)',
+        timeout_seconds = 1,
+    ),
+
+    # 3. 异常前已有输出
+    InProcessModeCase(
+        script_content = 'print("partial")\nraise ValueError("boom")',
+        timeout_seconds = 1,
+    ),
+
+    # 4. sys.exit 不应结束宿主进程
+    InProcessModeCase(
+        script_content = 'import sys; print("bye", end = ""); sys.exit(3)',
+        timeout_seconds = 1,
+    ),
+
+    # 5. sys.exit(0) 视为成功
+    InProcessModeCase(
+        script_content = 'import sys; print("ok", end = ""); sys.exit(0)',
+        timeout_seconds = 1,
+    ),
+
+    # 6. 死循环由看门狗超时终止
+    InProcessModeCase(
+        script_content = 'while True: pass',
+        timeout_seconds = 1,
+    ),
+]
+
+
+@skipIf(not supports_mode, "当前 pywheels 的 execute_python_script 尚不支持 mode 参数")
+class TestInProcessMode(TestCase):
+
+    def test_same_result_contract(self):
+
+        for i, case in enumerate(in_process_mode_cases):
+
+            with self.subTest(i = i):
+
+                subprocess_result = execute_python_script(
+                    script_content = case.script_content,
+                    timeout_seconds = case.timeout_seconds,
+                    mode = "subprocess",
+                )
+
+                in_process_result = execute_python_script(
+                    script_content = case.script_content,
+                    timeout_seconds = case.timeout_seconds,
+                    mode = "in_process",
+                )
+
+                self.assertEqual(in_process_result["success"], subprocess_result["success"])
+                self.assertEqual(in_process_result["stdout"], subprocess_result["stdout"])
+                self.assertEqual(in_process_result["timeout"], subprocess_result["timeout"])
+
+
+    def test_isolated_namespace(self):
+
+        execute_python_script(
+            script_content = "leaked_value = 114514",
+            mode = "in_process",
+        )
+
+        run_script_result = execute_python_script(
+            script_content = 'print("leaked_value" in globals(), end = "")',
+            mode = "in_process",
+        )
+
+        self.assertEqual(run_script_result["stdout"], "False")
+
+
+    def test_restricted_namespace(self):
+
+        forbidden_file_path = get_temp_file_path(
+            suffix = ".txt",
+            prefix = "tmp_ShouldNotExist_DeleteMe_",
+            directory = None,
+        )
+        self.addCleanup(delete_file, forbidden_file_path)
+
+        # 受限命名空间中不提供文件与进程相关的能力
+        for i, script in enumerate([
+            f'open({forbidden_file_path!r}, "w")',
+            f'import os; os.system("touch " + {forbidden_file_path!r})',
+            'import subprocess',
+        ]):
+
+            with self.subTest(i = i):
+
+                run_script_result = execute_python_script(
+                    script_content = script,
+                    mode = "in_process",
+                )
+
+                self.assertFalse(run_script_result["success"])
+                self.assertFalse(os.path.exists(forbidden_file_path))
+
+
+    def test_faster_than_subprocess(self):
+
+        script_content = in_process_mode_cases[0].script_content
+        run_num = 20
+
+        start = perf_counter()
+        for _ in range(run_num):
+            execute_python_script(script_content, timeout_seconds = 1, mode = "subprocess")
+        subprocess_seconds = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(run_num):
+            execute_python_script(script_content, timeout_seconds = 1, mode = "in_process")
+        in_process_seconds = perf_counter() - start
+
+        self.assertLess(
+            in_process_seconds * 10, subprocess_seconds,
+            msg = (
+                f"子进程模式 {run_num} 次用时 {subprocess_seconds:.3f} 秒，"
+                f"进程内模式 {run_num} 次用时 {in_process_seconds:.3f} 秒"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
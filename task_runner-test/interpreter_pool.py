@@ -0,0 +1,188 @@
+from time import perf_counter
+from collections import namedtuple
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.task_runner.task_runner import execute_python_script
+
+try:
+    from pywheels.task_runner.task_runner import PythonInterpreterPool
+except ImportError:
+    PythonInterpreterPool = None
+
+
+InterpreterPoolCase = namedtuple(
+    "InterpreterPoolCase",
+    [
+        "script_content", "timeout_seconds",
+    ]
+)
+
+
+interpreter_pool_cases = [
+
+    # 1. 最简单的输出
+    InterpreterPoolCase(
+        script_content = 'print(1 + 1, end = "")',
+        timeout_seconds = 5,
+    ),
+
+    # 2. 依赖 __main__ 入口（ansatz-apply_to.py 生成的脚本就是这种形式）
+    InterpreterPoolCase(
+        script_content = (
+            'import numpy as np\n'
+            'if __name__ == "__main__":\n'
+            '    print(np.cos(0.0), end = "")\n'
+        ),
+        timeout_seconds = 5,
+    ),
+
+    # 3. 抛出异常，success 应为 False
+    InterpreterPoolCase(
+        script_content = 'print("before"); raise ValueError("boom")',
+        timeout_seconds = 5,
+    ),
+
+    # 4. 显式非零退出
+    InterpreterPoolCase(
+        script_content = 'import sys; print("bye"); sys.exit(3)',
+        timeout_seconds = 5,
+    ),
+
+    # 5. 超时
+    InterpreterPoolCase(
+        script_content = 'import time; time.sleep(10)',
+        timeout_seconds = 1,
+    ),
+]
+
+
+@skipIf(PythonInterpreterPool is None, "当前 pywheels 尚未提供 PythonInterpreterPool")
+class TestInterpreterPool(TestCase):
+
+    def test_same_result_contract(self):
+
+        with PythonInterpreterPool(
+            python_command = "python",
+            preload_modules = ["numpy"],
+            worker_num = 2,
+            max_runs_per_worker = 3,
+        ) as interpreter_pool:
+
+            for i, case in enumerate(interpreter_pool_cases):
+
+                with self.subTest(i = i):
+
+                    cold_result = execute_python_script(
+                        script_content = case.script_content,
+                        timeout_seconds = case.timeout_seconds,
+                    )
+
+                    warm_result = execute_python_script(
+                        script_content = case.script_content,
+                        timeout_seconds = case.timeout_seconds,
+                        interpreter_pool = interpreter_pool,
+                    )
+
+                    self.assertEqual(warm_result["success"], cold_result["success"])
+                    self.assertEqual(warm_result["stdout"], cold_result["stdout"])
+                    self.assertEqual(warm_result["timeout"], cold_result["timeout"])
+
+
+    def test_isolated_namespace(self):
+
+        with PythonInterpreterPool(worker_num = 1) as interpreter_pool:
+
+            first_result = interpreter_pool.execute_python_script(
+                script_content = "leaked_value = 114514",
+            )
+
+            second_result = interpreter_pool.execute_python_script(
+                script_content = 'print("leaked_value" in globals(), end = "")',
+            )
+
+            self.assertTrue(first_result["success"])
+            self.assertEqual(second_result["stdout"], "False")
+
+
+    def test_recycle_after_max_runs(self):
+
+        max_runs_per_worker = 3
+
+        with PythonInterpreterPool(
+            worker_num = 1,
+            max_runs_per_worker = max_runs_per_worker,
+        ) as interpreter_pool:
+
+            pids = [
+                interpreter_pool.execute_python_script(
+                    script_content = 'import os; print(os.getpid(), end = "")',
+                )["stdout"]
+                for _ in range(3 * max_runs_per_worker + 1)
+            ]
+
+        # 每个工作进程恰好运行 max_runs_per_worker 个脚本后被替换
+        for start in range(0, len(pids), max_runs_per_worker):
+
+            with self.subTest(start = start):
+
+                self.assertEqual(len(set(pids[start : start + max_runs_per_worker])), 1)
+
+        self.assertEqual(len(set(pids)), 4)
+
+
+    def test_recycle_after_crash(self):
+
+        with PythonInterpreterPool(worker_num = 1) as interpreter_pool:
+
+            crash_result = interpreter_pool.execute_python_script(
+                script_content = "import os; os._exit(1)",
+            )
+
+            # 工作进程崩溃后应被替换，后续脚本照常运行
+            next_result = interpreter_pool.execute_python_script(
+                script_content = 'print(6 * 7, end = "")',
+            )
+
+            self.assertFalse(crash_result["success"])
+            self.assertTrue(next_result["success"])
+            self.assertEqual(next_result["stdout"], "42")
+
+
+    def test_warm_faster_than_cold(self):
+
+        script_content = 'import numpy as np\nprint(np.sqrt(2.0), end = "")'
+        run_num = 20
+
+        start = perf_counter()
+        for _ in range(run_num):
+            execute_python_script(script_content, timeout_seconds = 5)
+        cold_seconds = perf_counter() - start
+
+        with PythonInterpreterPool(
+            preload_modules = ["numpy"],
+            worker_num = 1,
+        ) as interpreter_pool:
+
+            start = perf_counter()
+            for _ in range(run_num):
+                interpreter_pool.execute_python_script(script_content, timeout_seconds = 5)
+            warm_seconds = perf_counter() - start
+
+        self.assertLess(
+            warm_seconds, cold_seconds,
+            msg = (
+                f"冷启动 {run_num} 次用时 {cold_seconds:.2f} 秒，"
+                f"预热解释器池 {run_num} 次用时 {warm_seconds:.2f} 秒"
+            ),
+        )
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
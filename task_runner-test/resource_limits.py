@@ -0,0 +1,106 @@
+import sys
+import signal
+from inspect import signature
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.task_runner.task_runner import execute_python_script
+
+
+# 当前发布版本尚未提供资源限制参数时跳过
+supports_resource_limits = "memory_limit_bytes" in signature(execute_python_script).parameters
+
+
+@skipIf(sys.platform == "win32", "resource 模块仅在 POSIX 平台可用")
+@skipIf(not supports_resource_limits, "当前 pywheels 的 execute_python_script 尚不支持资源限制")
+class TestResourceLimits(TestCase):
+
+    def test_memory_limit(self):
+
+        run_script_result = execute_python_script(
+            script_content = "blob = bytearray(1024 * 1024 * 1024)",
+            timeout_seconds = 10,
+            memory_limit_bytes = 256 * 1024 * 1024,
+        )
+
+        self.assertFalse(run_script_result["success"])
+        self.assertFalse(run_script_result["timeout"])
+        self.assertIn("MemoryError", run_script_result["stderr"])
+
+
+    def test_cpu_limit(self):
+
+        run_script_result = execute_python_script(
+            script_content = "while True: pass",
+            timeout_seconds = 30,
+            cpu_limit_seconds = 1,
+        )
+
+        # 应由 CPU 时间限制（SIGXCPU）终止，而不是等到 timeout_seconds
+        self.assertFalse(run_script_result["success"])
+        self.assertFalse(run_script_result["timeout"])
+        self.assertIn(
+            run_script_result["exit_signal"],
+            (signal.SIGXCPU, signal.SIGKILL),
+        )
+        self.assertLess(run_script_result["wall_time_seconds"], 10)
+
+
+    def test_open_files_limit(self):
+
+        run_script_result = execute_python_script(
+            script_content = (
+                "import tempfile\n"
+                "handles = [tempfile.TemporaryFile() for _ in range(100)]\n"
+            ),
+            timeout_seconds = 10,
+            open_files_limit = 32,
+        )
+
+        self.assertFalse(run_script_result["success"])
+        self.assertIn("Too many open files", run_script_result["stderr"])
+
+
+    def test_accounting(self):
+
+        run_script_result = execute_python_script(
+            script_content = (
+                "import time\n"
+                "blob = bytearray(64 * 1024 * 1024)\n"
+                "total = sum(range(10 ** 7))\n"
+                "time.sleep(0.5)\n"
+                "print(total, end = \"\")\n"
+            ),
+            timeout_seconds = 10,
+        )
+
+        self.assertTrue(run_script_result["success"])
+        self.assertIsNone(run_script_result["exit_signal"])
+        self.assertGreaterEqual(run_script_result["wall_time_seconds"], 0.5)
+        self.assertGreater(run_script_result["cpu_time_seconds"], 0.0)
+        self.assertLess(
+            run_script_result["cpu_time_seconds"],
+            run_script_result["wall_time_seconds"],
+        )
+        self.assertGreaterEqual(run_script_result["peak_rss_bytes"], 64 * 1024 * 1024)
+
+
+    def test_exit_signal(self):
+
+        run_script_result = execute_python_script(
+            script_content = "import os, signal; os.kill(os.getpid(), signal.SIGTERM)",
+            timeout_seconds = 10,
+        )
+
+        self.assertFalse(run_script_result["success"])
+        self.assertEqual(run_script_result["exit_signal"], signal.SIGTERM)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,147 @@
+from time import sleep
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.task_runner.task_runner import execute_python_script
+
+try:
+    from pywheels.task_runner.task_runner import ScriptResultCache
+except ImportError:
+    ScriptResultCache = None
+
+
+def _make_counting_script(
+    counter_file_path: str,
+    output: str,
+)-> str:
+
+    # 每真正运行一次就往计数文件里追加一个字符，用来判断是否启动了子进程
+    return (
+        f"with open({counter_file_path!r}, 'a') as file_pointer:\n"
+        f"    file_pointer.write('.')\n"
+        f"print({output!r}, end = '')\n"
+    )
+
+
+@skipIf(ScriptResultCache is None, "当前 pywheels 尚未提供 ScriptResultCache")
+class TestScriptResultCache(TestCase):
+
+    def setUp(self):
+
+        self.counter_file_path = get_temp_file_path(
+            suffix = ".txt",
+            prefix = "tmp_RunCounter_DeleteMe_",
+            directory = None,
+        )
+
+
+    def tearDown(self):
+
+        delete_file(file_path = self.counter_file_path)
+
+
+    def _get_run_num(self)-> int:
+
+        try:
+            with open(self.counter_file_path, "r") as file_pointer:
+                return len(file_pointer.read())
+        except FileNotFoundError:
+            return 0
+
+
+    def test_hit_skips_process(self):
+
+        result_cache = ScriptResultCache(max_entries = 16)
+        script = _make_counting_script(self.counter_file_path, "cached")
+
+        first_result = execute_python_script(script, result_cache = result_cache)
+        second_result = execute_python_script(script, result_cache = result_cache)
+
+        self.assertEqual(self._get_run_num(), 1)
+        self.assertEqual(first_result["success"], second_result["success"])
+        self.assertEqual(first_result["stdout"], second_result["stdout"])
+
+        # 只约束这几个键，允许实现额外提供 hit_rate 等统计量
+        stats = result_cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["evictions"], 0)
+        self.assertEqual(stats["entries"], 1)
+
+
+    def test_key_includes_python_command(self):
+
+        result_cache = ScriptResultCache(max_entries = 16)
+        script = _make_counting_script(self.counter_file_path, "cached")
+
+        execute_python_script(script, python_command = "python", result_cache = result_cache)
+        execute_python_script(script, python_command = "python3", result_cache = result_cache)
+
+        self.assertEqual(self._get_run_num(), 2)
+
+
+    def test_lru_eviction(self):
+
+        result_cache = ScriptResultCache(max_entries = 2)
+        scripts = [
+            _make_counting_script(self.counter_file_path, str(i))
+            for i in range(3)
+        ]
+
+        execute_python_script(scripts[0], result_cache = result_cache)
+        execute_python_script(scripts[1], result_cache = result_cache)
+        execute_python_script(scripts[0], result_cache = result_cache)
+        execute_python_script(scripts[2], result_cache = result_cache)
+
+        # scripts[1] 最久未使用，应被淘汰；scripts[0] 仍在缓存中
+        execute_python_script(scripts[0], result_cache = result_cache)
+        self.assertEqual(self._get_run_num(), 3)
+
+        execute_python_script(scripts[1], result_cache = result_cache)
+        self.assertEqual(self._get_run_num(), 4)
+
+
+    def test_ttl_expiry(self):
+
+        result_cache = ScriptResultCache(max_entries = 16, ttl_seconds = 1)
+        script = _make_counting_script(self.counter_file_path, "cached")
+
+        execute_python_script(script, result_cache = result_cache)
+        sleep(1.5)
+        execute_python_script(script, result_cache = result_cache)
+
+        self.assertEqual(self._get_run_num(), 2)
+
+
+    def test_disk_persistence(self):
+
+        cache_path = get_temp_file_path(
+            suffix = ".pkl",
+            prefix = "tmp_ScriptResultCache_DeleteMe_",
+            directory = None,
+        )
+        self.addCleanup(delete_file, cache_path)
+
+        script = _make_counting_script(self.counter_file_path, "cached")
+
+        execute_python_script(
+            script, result_cache = ScriptResultCache(local_storage_path = cache_path),
+        )
+        run_script_result = execute_python_script(
+            script, result_cache = ScriptResultCache(local_storage_path = cache_path),
+        )
+
+        self.assertEqual(self._get_run_num(), 1)
+        self.assertEqual(run_script_result["stdout"], "cached")
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
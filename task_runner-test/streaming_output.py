@@ -0,0 +1,182 @@
+import os
+import signal
+from time import sleep
+from time import perf_counter
+from inspect import signature
+from unittest import TestCase
+from unittest import skipIf
+from unittest import main as unittest_main
+from pywheels.task_runner.task_runner import execute_python_script
+
+try:
+    from pywheels.task_runner.task_runner import stream_python_script
+except ImportError:
+    stream_python_script = None
+
+
+# 当前发布版本尚未提供流式参数时跳过相应用例
+supports_output_callback = "output_callback" in signature(execute_python_script).parameters
+supports_max_retained_bytes = "max_retained_bytes" in signature(execute_python_script).parameters
+
+
+def _kill_if_alive(
+    pid: int,
+)-> None:
+
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _is_process_alive(
+    pid: int,
+)-> bool:
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+chatty_script = r"""
+import sys
+for i in range(200000):
+    print(f"line {i:06d}")
+sys.stdout.flush()
+"""
+
+
+slow_progress_script = r"""
+import time
+for i in range(100):
+    print(f"progress {i}", flush = True)
+    time.sleep(0.1)
+"""
+
+
+# 先打印子进程 PID，再缓慢输出进度
+pid_progress_script = r"""
+import os, time
+print(f"pid {os.getpid()}", flush = True)
+for i in range(100):
+    print(f"progress {i}", flush = True)
+    time.sleep(0.1)
+"""
+
+
+class TestStreamingOutput(TestCase):
+
+    @skipIf(stream_python_script is None, "当前 pywheels 尚未提供 stream_python_script")
+    def test_generator_yields_chunks(self):
+
+        received = []
+
+        for stream_name, chunk in stream_python_script(
+            script_content = 'import sys\nprint("out", flush = True)\nprint("err", file = sys.stderr, flush = True)',
+            timeout_seconds = 5,
+        ):
+            received.append((stream_name, chunk))
+
+        self.assertEqual(
+            "".join(chunk for name, chunk in received if name == "stdout"), "out\n",
+        )
+        self.assertEqual(
+            "".join(chunk for name, chunk in received if name == "stderr"), "err\n",
+        )
+
+
+    @skipIf(stream_python_script is None, "当前 pywheels 尚未提供 stream_python_script")
+    def test_generator_early_stop(self):
+
+        received_text = ""
+        start = perf_counter()
+
+        output_stream = stream_python_script(
+            script_content = pid_progress_script,
+            timeout_seconds = 60,
+        )
+
+        # 片段不一定按行切分，因此在累积的输出上判断
+        for stream_name, chunk in output_stream:
+            if stream_name == "stdout": received_text += chunk
+            if "progress 3\n" in received_text: break
+
+        child_pid = int(received_text.splitlines()[0].split()[1])
+        self.addCleanup(_kill_if_alive, child_pid)
+
+        # 关闭生成器时应杀死并回收子进程
+        output_stream.close()
+        sleep(0.2)
+
+        self.assertFalse(_is_process_alive(child_pid))
+        self.assertLess(perf_counter() - start, 5)
+
+
+    @skipIf(not supports_output_callback, "当前 pywheels 的 execute_python_script 尚不支持 output_callback")
+    def test_callback_early_stop(self):
+
+        seen_lines = []
+
+        def on_output(
+            stream_name: str,
+            chunk: str,
+        )-> bool:
+
+            seen_lines.extend(chunk.splitlines())
+            # 返回 False 表示提前终止
+            return len(seen_lines) < 5
+
+        run_script_result = execute_python_script(
+            script_content = slow_progress_script,
+            timeout_seconds = 60,
+            output_callback = on_output,
+        )
+
+        self.assertFalse(run_script_result["success"])
+        self.assertFalse(run_script_result["timeout"])
+        self.assertTrue(run_script_result["stopped_by_callback"])
+        self.assertLess(len(seen_lines), 100)
+
+
+    @skipIf(not supports_max_retained_bytes, "当前 pywheels 的 execute_python_script 尚不支持 max_retained_bytes")
+    def test_retained_bytes_cap(self):
+
+        max_retained_bytes = 1024
+
+        run_script_result = execute_python_script(
+            script_content = chatty_script,
+            timeout_seconds = 30,
+            max_retained_bytes = max_retained_bytes,
+        )
+
+        self.assertTrue(run_script_result["success"])
+        self.assertTrue(run_script_result["stdout_truncated"])
+        self.assertLessEqual(
+            len(run_script_result["stdout"].encode("UTF-8")), max_retained_bytes,
+        )
+        # 保留的是输出的尾部
+        self.assertTrue(run_script_result["stdout"].endswith("line 199999\n"))
+
+
+    def test_default_is_unchanged(self):
+
+        run_script_result = execute_python_script(
+            script_content = 'print(1 + 1, end = "")',
+        )
+
+        self.assertTrue(run_script_result["success"])
+        self.assertEqual(run_script_result["stdout"], "2")
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()
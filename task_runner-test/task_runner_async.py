@@ -0,0 +1,181 @@
+import os
+import signal
+import asyncio
+from time import perf_counter
+from unittest import IsolatedAsyncioTestCase
+from unittest import expectedFailure
+from unittest import main as unittest_main
+from pywheels.file_tools.basic import get_temp_file_path
+from pywheels.file_tools.basic import delete_file
+from pywheels.task_runner.task_runner import execute_python_script
+from pywheels.task_runner.task_runner import execute_python_script_async
+from pywheels.task_runner.task_runner import run_tasks_concurrently_async
+
+
+def _kill_if_alive(
+    pid: int,
+)-> None:
+
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _is_process_alive(
+    pid: int,
+)-> bool:
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class TestExecutePythonScriptAsync(IsolatedAsyncioTestCase):
+
+    async def test_same_result_contract(self):
+
+        scripts = [
+            'print(1 + 1, end = "")',
+            'import sys; print("err", file = sys.stderr); sys.exit(2)',
+        ]
+
+        for i, script in enumerate(scripts):
+
+            with self.subTest(i = i):
+
+                # 同步版本放到线程中执行，避免在协程里阻塞事件循环
+                sync_result = await asyncio.to_thread(
+                    execute_python_script, script, timeout_seconds = 5,
+                )
+                async_result = await execute_python_script_async(script, timeout_seconds = 5)
+
+                self.assertEqual(async_result["success"], sync_result["success"])
+                self.assertEqual(async_result["stdout"], sync_result["stdout"])
+                self.assertEqual(async_result["stderr"], sync_result["stderr"])
+                self.assertEqual(async_result["exit_code"], sync_result["exit_code"])
+
+
+    async def test_event_loop_not_blocked(self):
+
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(_ticker())
+
+        await execute_python_script_async(
+            script_content = "import time; time.sleep(1)",
+            timeout_seconds = 5,
+        )
+
+        ticker_task.cancel()
+
+        # 子进程运行期间事件循环应当持续调度其他协程
+        self.assertGreater(ticks, 10)
+
+
+    async def test_timeout_kills_child(self):
+
+        run_script_result = await execute_python_script_async(
+            script_content = "import time; time.sleep(10)",
+            timeout_seconds = 1,
+        )
+
+        self.assertFalse(run_script_result["success"])
+        self.assertTrue(run_script_result["timeout"])
+
+
+    # execute_command_async 只在 Exception 分支中杀死子进程，而 asyncio.CancelledError
+    # 属于 BaseException，因此当前发布版本（pywheels 0.8.3.2）取消后子进程仍在运行
+    @expectedFailure
+    async def test_cancellation_kills_child(self):
+
+        pid_file_path = get_temp_file_path(
+            suffix = ".txt",
+            prefix = "tmp_PidFile_DeleteMe_",
+            directory = None,
+        )
+        self.addCleanup(delete_file, pid_file_path)
+
+        script = (
+            f"import os, time\n"
+            f"with open({pid_file_path!r}, 'w') as file_pointer:\n"
+            f"    file_pointer.write(str(os.getpid()))\n"
+            f"time.sleep(30)\n"
+        )
+
+        task = asyncio.create_task(
+            execute_python_script_async(script, timeout_seconds = 60)
+        )
+
+        # 子进程迟迟未启动属于环境问题而非上述已知缺陷，因此跳过而不计入预期失败
+        deadline = perf_counter() + 10
+        while not os.path.exists(pid_file_path) or not os.path.getsize(pid_file_path):
+            if perf_counter() > deadline or task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                self.skipTest("子进程未能在 10 秒内启动")
+            await asyncio.sleep(0.05)
+
+        with open(pid_file_path, "r") as file_pointer:
+            child_pid = int(file_pointer.read())
+
+        # 无论断言结果如何，都不把子进程遗留在后台
+        self.addCleanup(_kill_if_alive, child_pid)
+
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        # 取消后子进程应已被杀死并回收，而不是被遗弃在后台
+        await asyncio.sleep(0.2)
+        self.assertFalse(_is_process_alive(child_pid))
+
+
+    async def test_bounded_concurrency(self):
+
+        script_num = 8
+        max_workers = 2
+
+        start = perf_counter()
+
+        results = await run_tasks_concurrently_async(
+            task = execute_python_script_async,
+            task_indexers = list(range(script_num)),
+            task_inputs = [
+                ("import time; time.sleep(0.5)", 5)
+                for _ in range(script_num)
+            ],
+            max_workers = max_workers,
+            show_progress_bar = False,
+        )
+
+        end = perf_counter()
+
+        self.assertTrue(all(result["success"] for result in results.values()))
+
+        # 同时最多 2 个子进程，总耗时至少为 8 / 2 * 0.5 秒
+        self.assertGreaterEqual(end - start, script_num / max_workers * 0.5)
+
+
+def main():
+
+    unittest_main()
+
+
+if __name__ == "__main__":
+
+    main()